@@ -0,0 +1,209 @@
+"""Incremental analytics export and offline rollups.
+
+``flask export-analytics`` appends every Application row created or changed
+since the last run to a date-partitioned store of gzip'd CSV files:
+
+    <ANALYTICS_DIR>/applications/dt=YYYY-MM-DD/part-<run>.csv.gz
+    <ANALYTICS_DIR>/_watermark.json
+
+Rows are denormalised (company and position names are copied in) so the
+reports never need the serving database. A row that changes again later
+simply appears again in a newer part; readers keep the latest version per
+application_id. Applications removed with delete_applications() leave an
+ApplicationDeletion tombstone, exported as a row with ``deleted`` set, and
+readers drop an application whose latest version is such a tombstone.
+Rollups are then computed from the store alone:
+
+    <ANALYTICS_DIR>/rollups/applications_per_company.csv
+    <ANALYTICS_DIR>/rollups/daily_applications.csv
+    <ANALYTICS_DIR>/rollups/skill_gap_trends.csv
+"""
+import csv
+import glob
+import gzip
+import json
+import os
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+from extensions import db
+from models import Application, ApplicationDeletion, CompanyPosition, CompanyProfile
+
+FIELDS = [
+    'application_id', 'student_id', 'position_id', 'position_title', 'company_id', 'company_name',
+    'status', 'match_percentage', 'missing_skills', 'created_at', 'updated_at', 'deleted',
+]
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+# Rows younger than this are left for the next run so that transactions still
+# in flight when the watermark is taken cannot be skipped.
+SETTLE_SECONDS = 5
+
+
+def _read_watermark(store):
+    path = os.path.join(store, '_watermark.json')
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return datetime.strptime(json.load(f)['applications'], TIMESTAMP_FORMAT)
+
+
+def _write_watermark(store, watermark):
+    path = os.path.join(store, '_watermark.json')
+    with open(path + '.tmp', 'w') as f:
+        json.dump({'applications': watermark.strftime(TIMESTAMP_FORMAT)}, f)
+    os.replace(path + '.tmp', path)
+
+
+def delete_applications(*criteria):
+    """Delete the applications matching ``criteria``, leaving tombstones for the export"""
+    matching = db.select(Application.id, db.literal(datetime.utcnow())).where(*criteria)
+    db.session.execute(
+        db.insert(ApplicationDeletion).from_select(['application_id', 'deleted_at'], matching)
+    )
+    db.session.execute(db.delete(Application).where(*criteria).execution_options(synchronize_session=False))
+
+
+def export_applications(store, batch_size=5000):
+    """Append applications changed or deleted since the stored watermark; returns the number of rows written"""
+    since = _read_watermark(store)
+    until = datetime.utcnow() - timedelta(seconds=SETTLE_SECONDS)
+    # updated_at is defaulted on insert and backfilled by init_db, so it can be
+    # filtered on directly and ix_application_updated_at drives the scan
+    changed_at = Application.updated_at
+
+    query = db.session.query(
+        Application.id, Application.student_id, Application.position_id, CompanyPosition.title,
+        CompanyProfile.id, CompanyProfile.name, Application.status, Application.match_percentage,
+        Application.missing_skills, Application.created_at, changed_at
+    ).outerjoin(CompanyPosition, CompanyPosition.id == Application.position_id) \
+        .outerjoin(CompanyProfile, CompanyProfile.id == CompanyPosition.company_id) \
+        .filter(changed_at <= until)
+    if since is not None:
+        query = query.filter(changed_at > since)
+
+    deletions = db.session.query(ApplicationDeletion.application_id, ApplicationDeletion.deleted_at) \
+        .filter(ApplicationDeletion.deleted_at <= until)
+    if since is not None:
+        deletions = deletions.filter(ApplicationDeletion.deleted_at > since)
+
+    run = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')
+    writers = {}
+    written = 0
+
+    def write(row, changed):
+        day = changed.strftime('%Y-%m-%d')
+        if day not in writers:
+            partition = os.path.join(store, 'applications', f'dt={day}')
+            os.makedirs(partition, exist_ok=True)
+            path = os.path.join(partition, f'part-{run}.csv.gz')
+            f = gzip.open(path + '.tmp', 'wt', newline='')
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            writers[day] = (f, writer, path)
+        writers[day][1].writerow([
+            v.strftime(TIMESTAMP_FORMAT) if isinstance(v, datetime) else v for v in row
+        ])
+
+    try:
+        for row in query.order_by(changed_at, Application.id).execution_options(yield_per=batch_size):
+            row = list(row)
+            try:
+                row[8] = '|'.join(json.loads(row[8])) if row[8] else ''
+            except Exception:
+                row[8] = ''
+            write(row + [''], row[10])
+            written += 1
+        for application_id, deleted_at in deletions.order_by(ApplicationDeletion.deleted_at):
+            write([application_id] + [''] * 9 + [deleted_at, '1'], deleted_at)
+            written += 1
+    finally:
+        for f, _, _ in writers.values():
+            f.close()
+
+    # Parts only become visible to readers once complete
+    for _, _, path in writers.values():
+        os.replace(path + '.tmp', path)
+    _write_watermark(store, until)
+    return written
+
+
+def read_applications(store):
+    """Latest version of every exported application, keyed by application_id"""
+    latest = {}
+    for path in sorted(glob.glob(os.path.join(store, 'applications', 'dt=*', 'part-*.csv.gz'))):
+        with gzip.open(path, 'rt', newline='') as f:
+            for row in csv.DictReader(f):
+                current = latest.get(row['application_id'])
+                if current is None or row['updated_at'] >= current['updated_at']:
+                    latest[row['application_id']] = row
+    # Parts written before tombstones existed have no 'deleted' column
+    return {key: row for key, row in latest.items() if not row.get('deleted')}
+
+
+def build_rollups(store):
+    """Recompute the report tables from the exported store"""
+    rows = read_applications(store).values()
+
+    per_company = defaultdict(Counter)
+    names = {}
+    daily = Counter()
+    skill_gaps = Counter()
+    for row in rows:
+        names[row['company_id']] = row['company_name']
+        per_company[row['company_id']]['applications'] += 1
+        per_company[row['company_id']][row['status'] or 'applied'] += 1
+        day = row['created_at'][:10]
+        daily[day] += 1
+        for skill in filter(None, row['missing_skills'].split('|')):
+            skill_gaps[(day, skill)] += 1
+
+    out = os.path.join(store, 'rollups')
+    os.makedirs(out, exist_ok=True)
+
+    with open(os.path.join(out, 'applications_per_company.csv'), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['company_id', 'company_name', 'applications', 'shortlisted', 'accepted', 'rejected', 'acceptance_rate'])
+        for company_id, counts in sorted(per_company.items(), key=lambda item: -item[1]['applications']):
+            writer.writerow([
+                company_id, names[company_id], counts['applications'], counts['shortlisted'],
+                counts['accepted'], counts['rejected'],
+                round(counts['accepted'] / counts['applications'], 4),
+            ])
+
+    with open(os.path.join(out, 'daily_applications.csv'), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['day', 'applications'])
+        writer.writerows(sorted(daily.items()))
+
+    with open(os.path.join(out, 'skill_gap_trends.csv'), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['day', 'skill', 'applications_missing_skill'])
+        for (day, skill), count in sorted(skill_gaps.items(), key=lambda item: (item[0][0], -item[1])):
+            writer.writerow([day, skill, count])
+
+    return out
+
+
+@click.command('export-analytics')
+@click.option('--rollups/--no-rollups', default=True, help='Rebuild the rollup reports after exporting.')
+@with_appcontext
+def export_analytics_command(rollups):
+    """Append changed applications to the analytics store (run daily from cron)."""
+    store = current_app.config['ANALYTICS_DIR']
+    os.makedirs(store, exist_ok=True)
+    written = export_applications(store)
+    print(f'Exported {written} application row(s) to {store}')
+    if rollups:
+        print(f'Rollups written to {build_rollups(store)}')
+
+
+@click.command('build-rollups')
+@with_appcontext
+def build_rollups_command():
+    """Recompute the rollup reports from the analytics store only."""
+    print(f"Rollups written to {build_rollups(current_app.config['ANALYTICS_DIR'])}")
@@ -0,0 +1,33 @@
+"""Gunicorn settings for serving the placement app.
+
+Usage:
+    flask --app app init-db
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Every value can be overridden through the environment, e.g.
+``WEB_CONCURRENCY=8 GUNICORN_THREADS=2 gunicorn -c gunicorn.conf.py wsgi:app``.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Threaded workers: page rendering is CPU bound, but password hashing and
+# SQLite I/O release the GIL, so a few threads per process keep cores busy.
+worker_class = 'gthread'
+workers = int(os.environ.get('WEB_CONCURRENCY', min(multiprocessing.cpu_count() * 2 + 1, 9)))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Import the app once in the master so workers fork with templates and models loaded
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') == '1'
+
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+graceful_timeout = 30
+
+# Recycle workers now and then so per-process caches cannot grow without bound
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = 200
+
+accesslog = os.environ.get('GUNICORN_ACCESSLOG', '-')
+errorlog = '-'
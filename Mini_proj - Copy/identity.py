@@ -0,0 +1,22 @@
+from sqlalchemy.orm import configure_mappers, joinedload
+
+from extensions import db, login_manager
+from models import User
+
+# --- User Loader ---
+# Flask-Login memoises current_user for the length of a request. Loading the
+# profiles in the same query means routes never issue a second one for
+# current_user.student_profile / company_profile. Nothing is kept between
+# requests, so every worker process always sees the latest profile.
+
+# The profile attributes are backrefs, which only exist on User once the
+# mappers are configured; a fresh worker's first request gets here before that
+configure_mappers()
+
+@login_manager.user_loader
+def load_user(user_id):
+    """Load the user together with their profile so routes never query for it again"""
+    return db.session.execute(
+        db.select(User).options(joinedload(User.student_profile), joinedload(User.company_profile))
+        .filter_by(id=int(user_id))
+    ).unique().scalar_one_or_none()
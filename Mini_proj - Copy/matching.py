@@ -0,0 +1,118 @@
+import json
+
+from extensions import db
+from models import StudentProfile, CompanyProfile, CompanyPosition
+
+# --- Enhanced Matching Utilities ---
+def safe_set_from_json(json_text):
+    """Safely convert JSON string to set, return empty set if error"""
+    try:
+        return set(json.loads(json_text)) if json_text else set()
+    except Exception:
+        return set()
+
+def compute_position_match(student_skills_set, student_courses_set, position: CompanyPosition):
+    """Enhanced matching algorithm with detailed analysis"""
+    required_skills = safe_set_from_json(position.required_skills)
+    required_courses = safe_set_from_json(position.required_courses)
+
+    matched_skills = student_skills_set.intersection(required_skills)
+    missing_skills = required_skills - student_skills_set
+
+    matched_courses = student_courses_set.intersection(required_courses)
+    missing_courses = required_courses - student_courses_set
+
+    # Calculate individual scores
+    skills_den = len(required_skills)
+    courses_den = len(required_courses)
+    skills_score = (len(matched_skills) / skills_den) if skills_den > 0 else 1.0
+    courses_score = (len(matched_courses) / courses_den) if courses_den > 0 else 1.0
+
+    # Weighted overall score (skills are more important)
+    overall = (0.8 * skills_score) + (0.2 * courses_score)
+    match_percentage = round(overall * 100, 1)
+    
+    # Eligibility check
+    is_eligible = match_percentage >= 100
+
+    return {
+        'match_percentage': match_percentage,
+        'matched_skills': matched_skills,
+        'missing_skills': missing_skills,
+        'matched_courses': matched_courses,
+        'missing_courses': missing_courses,
+        'is_eligible': is_eligible,
+        'skills_score': round(skills_score * 100, 1),
+        'courses_score': round(courses_score * 100, 1)
+    }
+
+def calculate_student_company_match(student, company):
+    """Calculate match between a student and company requirements"""
+    student_skills = safe_set_from_json(student.skills)
+    student_courses = safe_set_from_json(student.courses)
+    company_skills = safe_set_from_json(company.required_skills)
+    company_courses = safe_set_from_json(company.required_courses)
+    
+    # Calculate matches
+    matched_skills = student_skills.intersection(company_skills)
+    missing_skills = company_skills - student_skills
+    matched_courses = student_courses.intersection(company_courses)
+    missing_courses = company_courses - student_courses
+    
+    # Calculate percentages
+    total_required_skills = len(company_skills)
+    total_required_courses = len(company_courses)
+    
+    skills_percentage = (len(matched_skills) / total_required_skills * 100) if total_required_skills > 0 else 100
+    courses_percentage = (len(matched_courses) / total_required_courses * 100) if total_required_courses > 0 else 100
+    
+    # Overall match percentage (weighted: 80% skills, 20% courses)
+    overall_percentage = round((0.8 * skills_percentage) + (0.2 * courses_percentage), 1)
+    
+    # Eligibility check
+    is_eligible = overall_percentage >= 100
+    
+    return {
+        'student': student,
+        'company': company,
+        'match_percentage': overall_percentage,
+        'skills_percentage': round(skills_percentage, 1),
+        'courses_percentage': round(courses_percentage, 1),
+        'matched_skills': list(matched_skills),
+        'missing_skills': list(missing_skills),
+        'matched_courses': list(matched_courses),
+        'missing_courses': list(missing_courses),
+        'is_eligible': is_eligible,
+        'total_required_skills': total_required_skills,
+        'total_required_courses': total_required_courses
+    }
+
+
+def get_company_candidate_analysis(company_id, session=None):
+    """Get detailed analysis of all candidates for a specific company
+
+    ``session`` defaults to the app session; reports pass the snapshot's for
+    the student scan. The company itself is always read live, so a profile
+    saved after the snapshot was taken is found.
+    """
+    company = db.session.get(CompanyProfile, company_id)
+    if not company:
+        return None
+    
+    students = (session or db.session).query(StudentProfile).all()
+    candidates = []
+    
+    for student in students:
+        match_data = calculate_student_company_match(student, company)
+        candidates.append(match_data)
+    
+    # Sort by match percentage (highest first)
+    candidates.sort(key=lambda x: x['match_percentage'], reverse=True)
+    
+    return {
+        'company': company,
+        'candidates': candidates,
+        'total_candidates': len(candidates),
+        'eligible_candidates': len([c for c in candidates if c['is_eligible']]),
+        'average_match': round(sum(c['match_percentage'] for c in candidates) / len(candidates), 1) if candidates else 0
+    }
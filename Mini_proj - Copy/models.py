@@ -0,0 +1,112 @@
+from datetime import datetime
+
+from flask import current_app
+from flask_login import UserMixin
+
+from extensions import db
+from security import expand_hash_method, hash_password, verify_password
+
+APPLICATION_STATUSES = ('applied', 'reviewed', 'shortlisted', 'rejected', 'accepted')
+
+# Database Models
+class User(UserMixin, db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(80), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    password_hash = db.Column(db.String(128))
+    user_type = db.Column(db.String(20))  # 'student' or 'company'
+    
+    def set_password(self, password):
+        self.password_hash = hash_password(password)
+    
+    def check_password(self, password):
+        return verify_password(self.password_hash, password)
+
+    def needs_rehash(self):
+        """True when the stored hash was made with different cost parameters"""
+        method = (self.password_hash or '').split('$', 1)[0]
+        return method != expand_hash_method(current_app.config['PASSWORD_HASH_METHOD'])
+
+class StudentProfile(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    college = db.Column(db.String(200), nullable=False)
+    cgpa = db.Column(db.Float, nullable=False)
+    skills = db.Column(db.Text)  # JSON string of skills
+    courses = db.Column(db.Text)  # JSON string of completed courses
+    projects = db.Column(db.Text)  # JSON string of projects
+    resume_path = db.Column(db.String(300))
+    photo_path = db.Column(db.String(300))
+    
+    user = db.relationship('User', backref=db.backref('student_profile', uselist=False))
+
+    __table_args__ = (
+        db.Index('uq_student_profile_user', 'user_id', unique=True),
+    )
+
+class CompanyProfile(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    name = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.Text)
+    required_skills = db.Column(db.Text)  # JSON string
+    min_cgpa = db.Column(db.Float)
+    required_courses = db.Column(db.Text)  # JSON string
+    
+    user = db.relationship('User', backref=db.backref('company_profile', uselist=False))
+
+    __table_args__ = (
+        db.Index('uq_company_profile_user', 'user_id', unique=True),
+    )
+
+class CourseSuggestion(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False)
+    platform = db.Column(db.String(100))  # Coursera, Udemy, etc.
+    url = db.Column(db.String(300))
+    skills_covered = db.Column(db.Text)  # JSON string
+
+class CompanyPosition(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    company_id = db.Column(db.Integer, db.ForeignKey('company_profile.id'), nullable=False)
+    title = db.Column(db.String(150), nullable=False)
+    domain = db.Column(db.String(150))
+    description = db.Column(db.Text)
+    required_skills = db.Column(db.Text)  # JSON list
+    required_courses = db.Column(db.Text)  # JSON list
+    min_cgpa = db.Column(db.Float)
+    
+    company = db.relationship('CompanyProfile', backref=db.backref('positions', lazy=True))
+
+class Application(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('student_profile.id'), nullable=False)
+    position_id = db.Column(db.Integer, db.ForeignKey('company_position.id'), nullable=False)
+    status = db.Column(db.String(50), default='applied')  # applied, reviewed, shortlisted, rejected, accepted
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # watermark for the analytics export
+    match_percentage = db.Column(db.Float)
+    matched_skills = db.Column(db.Text)  # JSON list
+    missing_skills = db.Column(db.Text)  # JSON list
+
+    __table_args__ = (
+        db.UniqueConstraint('student_id', 'position_id', name='uq_student_position'),
+        # Pipeline view: per-status counts and status-filtered lists ranked by match
+        db.Index('ix_application_position_status_match', 'position_id', 'status', 'match_percentage'),
+        # Pipeline view without a status filter: all applicants ranked by match
+        db.Index('ix_application_position_match', 'position_id', 'match_percentage'),
+        db.Index('ix_application_updated_at', 'updated_at'),
+    )
+
+class ReadModelChange(db.Model):
+    """Append-only log of writes the per-process dashboard read models must pick up"""
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(db.String(20), nullable=False)  # 'student', 'position' or 'company'
+    row_id = db.Column(db.Integer, nullable=False)
+
+class ApplicationDeletion(db.Model):
+    """Tombstone for a hard-deleted Application so the analytics export can drop it too"""
+    id = db.Column(db.Integer, primary_key=True)
+    application_id = db.Column(db.Integer, nullable=False)
+    deleted_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -0,0 +1,297 @@
+"""Compact in-memory read model for the dashboards.
+
+Students and positions are kept as small ``__slots__`` records holding only
+what matching needs: id, CGPA and the skill/course sets encoded as integer
+bitsets. Records are built from column-only queries (no ORM identity map,
+no lazy relationships). Every worker process holds its own copy, so the
+write paths append to the shared ReadModelChange log instead of touching
+the model directly; before serving, each process reads the log's newest id
+and re-reads just the rows changed since it last looked. A full rebuild
+still happens every READ_MODEL_TTL seconds (for writes made outside the
+app) but runs on a background thread while the old model keeps serving.
+"""
+import threading
+import time
+
+from flask import current_app
+
+from extensions import db
+from matching import safe_set_from_json
+from models import StudentProfile, CompanyProfile, CompanyPosition, ReadModelChange
+
+
+class BitIndex:
+    """Assigns each distinct name (skill or course) a bit position"""
+
+    def __init__(self):
+        self.bits = {}
+        self.names = []
+        self._lock = threading.Lock()
+
+    def encode(self, names):
+        mask = 0
+        for name in names:
+            bit = self.bits.get(name)
+            if bit is None:
+                with self._lock:
+                    bit = self.bits.get(name)
+                    if bit is None:
+                        bit = len(self.names)
+                        self.names.append(name)
+                        self.bits[name] = bit
+            mask |= 1 << bit
+        return mask
+
+    def decode(self, mask):
+        names = []
+        while mask:
+            low = mask & -mask
+            names.append(self.names[low.bit_length() - 1])
+            mask ^= low
+        return names
+
+
+class StudentRecord:
+    __slots__ = ('id', 'cgpa', 'skills', 'courses')
+
+    def __init__(self, id, cgpa, skills, courses):
+        self.id = id
+        self.cgpa = cgpa
+        self.skills = skills
+        self.courses = courses
+
+
+class PositionRecord:
+    __slots__ = ('id', 'company_id', 'min_cgpa', 'skills', 'courses')
+
+    def __init__(self, id, company_id, min_cgpa, skills, courses):
+        self.id = id
+        self.company_id = company_id
+        self.min_cgpa = min_cgpa  # position's own minimum, falling back to the company's
+        self.skills = skills
+        self.courses = courses
+
+
+def position_match_percentage(skills, courses, required_skills, required_courses):
+    """Bitset version of the score computed by compute_position_match"""
+    skills_den = required_skills.bit_count()
+    courses_den = required_courses.bit_count()
+    skills_score = ((skills & required_skills).bit_count() / skills_den) if skills_den > 0 else 1.0
+    courses_score = ((courses & required_courses).bit_count() / courses_den) if courses_den > 0 else 1.0
+    return round(((0.8 * skills_score) + (0.2 * courses_score)) * 100, 1)
+
+def company_match_percentage(skills, courses, required_skills, required_courses):
+    """Bitset version of the score computed by calculate_student_company_match"""
+    skills_den = required_skills.bit_count()
+    courses_den = required_courses.bit_count()
+    skills_percentage = ((skills & required_skills).bit_count() / skills_den * 100) if skills_den > 0 else 100
+    courses_percentage = ((courses & required_courses).bit_count() / courses_den * 100) if courses_den > 0 else 100
+    return round((0.8 * skills_percentage) + (0.2 * courses_percentage), 1)
+
+
+class ReadModel:
+    def __init__(self):
+        self.skill_index = BitIndex()
+        self.course_index = BitIndex()
+        self.students = {}
+        self.positions = {}
+        self.skill_counts = {}  # bit -> number of students with that skill
+        self.loaded_at = None
+        self.seen_change = 0  # newest ReadModelChange id already applied
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    # --- loading ---
+    def load(self, batch_size=2000):
+        """Populate from column-only queries"""
+        # Taken first: changes logged while loading are re-applied by sync(), which is idempotent
+        self.seen_change = db.session.query(db.func.max(ReadModelChange.id)).scalar() or 0
+
+        rows = _student_rows().execution_options(yield_per=batch_size)
+        for row in rows:
+            self._put_student(self._student_record(*row))
+
+        for row in _position_rows().execution_options(yield_per=batch_size):
+            record = self._position_record(*row)
+            self.positions[record.id] = record
+
+        self.loaded_at = time.monotonic()
+        return self
+
+    def _student_record(self, id, cgpa, skills, courses):
+        return StudentRecord(
+            id, cgpa,
+            self.skill_index.encode(safe_set_from_json(skills)),
+            self.course_index.encode(safe_set_from_json(courses)),
+        )
+
+    def _position_record(self, id, company_id, min_cgpa, company_min_cgpa, skills, courses):
+        return PositionRecord(
+            id, company_id,
+            min_cgpa if min_cgpa is not None else company_min_cgpa,
+            self.skill_index.encode(safe_set_from_json(skills)),
+            self.course_index.encode(safe_set_from_json(courses)),
+        )
+
+    def _put_student(self, record):
+        old = self.students.get(record.id)
+        if old is not None:
+            self._count_skills(old.skills, -1)
+        self.students[record.id] = record
+        self._count_skills(record.skills, 1)
+
+    def _count_skills(self, mask, delta):
+        while mask:
+            low = mask & -mask
+            bit = low.bit_length() - 1
+            self.skill_counts[bit] = self.skill_counts.get(bit, 0) + delta
+            mask ^= low
+
+    # --- incremental updates from the change log ---
+    def sync(self):
+        """Apply rows changed since the last sync; False if the log was pruned past this model"""
+        oldest, newest = db.session.query(db.func.min(ReadModelChange.id), db.func.max(ReadModelChange.id)).one()
+        if newest is None or newest <= self.seen_change:
+            return True
+        with self._sync_lock:
+            seen = self.seen_change
+            if newest <= seen:
+                return True
+            changes = db.session.query(ReadModelChange.kind, ReadModelChange.row_id) \
+                .filter(ReadModelChange.id > seen, ReadModelChange.id <= newest).all()
+            ids = {'student': set(), 'position': set(), 'company': set()}
+            for kind, row_id in changes:
+                ids[kind].add(row_id)
+
+            students = load_in_chunks(_student_rows(), StudentProfile.id, list(ids['student']))
+            positions = load_in_chunks(_position_rows(), CompanyPosition.id, list(ids['position']))
+            positions += load_in_chunks(_position_rows(), CompanyPosition.company_id, list(ids['company']))
+            student_records = [self._student_record(*row) for row in students]
+            position_records = [self._position_record(*row) for row in positions]
+
+            with self._lock:
+                for record in student_records:
+                    self._put_student(record)
+                found = {record.id for record in position_records}
+                for position_id in ids['position'] - found:
+                    self.positions.pop(position_id, None)  # deleted
+                for record in position_records:
+                    self.positions[record.id] = record
+            self.seen_change = newest
+        return oldest <= seen + 1
+
+    # --- queries ---
+    def student_records(self):
+        with self._lock:
+            return list(self.students.values())
+
+    def position_records(self):
+        with self._lock:
+            return list(self.positions.values())
+
+    def skill_distribution(self):
+        with self._lock:
+            counts = list(self.skill_counts.items())
+        return {self.skill_index.names[bit]: count for bit, count in counts if count > 0}
+
+    def match_students(self, required_skills, required_courses, min_cgpa=None, threshold=0):
+        """Ids of students scoring at least ``threshold`` against the given requirements"""
+        req_skills = self.skill_index.encode(required_skills)
+        req_courses = self.course_index.encode(required_courses)
+        return [
+            s.id for s in self.student_records()
+            if not (min_cgpa and s.cgpa < min_cgpa)
+            and company_match_percentage(s.skills, s.courses, req_skills, req_courses) >= threshold
+        ]
+
+    def match_positions(self, skills, courses, cgpa, threshold=0):
+        """Ids of positions a student with these skills/courses/CGPA scores at least ``threshold`` on"""
+        student_skills = self.skill_index.encode(skills)
+        student_courses = self.course_index.encode(courses)
+        return [
+            p.id for p in self.position_records()
+            if not (p.min_cgpa and cgpa < p.min_cgpa)
+            and position_match_percentage(student_skills, student_courses, p.skills, p.courses) >= threshold
+        ]
+
+
+def _student_rows():
+    return db.session.query(StudentProfile.id, StudentProfile.cgpa, StudentProfile.skills, StudentProfile.courses)
+
+
+def _position_rows():
+    return db.session.query(
+        CompanyPosition.id, CompanyPosition.company_id, CompanyPosition.min_cgpa,
+        CompanyProfile.min_cgpa, CompanyPosition.required_skills, CompanyPosition.required_courses
+    ).join(CompanyProfile, CompanyProfile.id == CompanyPosition.company_id)
+
+
+# Entries kept in the change log; a process that falls further behind rebuilds instead
+CHANGE_LOG_KEEP = 10000
+
+_first_load_lock = threading.Lock()
+_rebuilding = threading.Lock()
+
+def get_read_model():
+    """The app's read model, synced with the change log; rebuilt in the background after READ_MODEL_TTL"""
+    app = current_app._get_current_object()
+    model = app.extensions.get('read_model')
+    if model is None:
+        # Nothing to serve yet, so the first load has to happen in the request
+        with _first_load_lock:
+            model = app.extensions.get('read_model')
+            if model is None:
+                model = ReadModel().load()
+                app.extensions['read_model'] = model
+    complete = model.sync()
+    if not complete or time.monotonic() - model.loaded_at > app.config['READ_MODEL_TTL']:
+        _rebuild_in_background(app)
+    return model
+
+
+def _rebuild_in_background(app):
+    if not _rebuilding.acquire(blocking=False):
+        return  # one rebuild per process at a time
+
+    def run():
+        try:
+            with app.app_context():
+                model = ReadModel().load()
+                model.sync()
+                app.extensions['read_model'] = model
+                db.session.query(ReadModelChange).filter(
+                    ReadModelChange.id <= model.seen_change - CHANGE_LOG_KEEP
+                ).delete(synchronize_session=False)
+                db.session.commit()
+        except Exception:
+            app.logger.exception('Rebuilding the read model failed')
+        finally:
+            _rebuilding.release()
+
+    threading.Thread(target=run, name='read-model-rebuild', daemon=True).start()
+
+
+def _log_change(kind, row_id):
+    db.session.add(ReadModelChange(kind=kind, row_id=row_id))
+    db.session.commit()
+
+def student_saved(profile):
+    _log_change('student', profile.id)
+
+def position_saved(position):
+    _log_change('position', position.id)
+
+def position_deleted(position_id):
+    _log_change('position', position_id)
+
+def company_saved(company):
+    # The company's minimum CGPA is the fallback for its positions
+    _log_change('company', company.id)
+
+
+def load_in_chunks(query, column, ids, chunk_size=500):
+    """Fetch rows whose ``column`` is in ``ids`` without exceeding SQLite's parameter limit"""
+    rows = []
+    for i in range(0, len(ids), chunk_size):
+        rows.extend(query.filter(column.in_(ids[i:i + chunk_size])).all())
+    return rows
@@ -0,0 +1,213 @@
+"""Skill-gap recommendations for the student dashboard.
+
+A RecommendationEngine is built from the read model's compact records:
+
+* a sparse skill co-occurrence matrix over every student's skills and every
+  position's requirements, used as P(b | a) - how often someone who has
+  (or is asked for) skill ``a`` also has skill ``b``;
+* the positions' required-skill bitsets with their CGPA cut-offs;
+* the course catalogue with ``skills_covered`` encoded as bitsets.
+
+Answering a request is then a greedy set cover over the student's missing
+skills: repeatedly pick the skill that completes the most eligible
+positions, breaking ties on how many positions it brings closer and then on
+its co-occurrence with what the student already knows. Courses are chosen
+the same way to cover the picked skills. Answers are cached per skill
+set/CGPA. Each process builds its engine on a background thread, and the
+dashboard shows no recommendations until the first one is ready. The thread
+then checks every RECOMMENDER_REFRESH seconds and rebuilds only if the read
+model's change log or the course catalogue has moved on.
+"""
+import os
+import random
+import threading
+import time
+from typing import NamedTuple
+
+from flask import current_app
+
+from extensions import db
+from matching import safe_set_from_json
+from models import CourseSuggestion
+from readmodel import get_read_model
+from viewmodels import CourseView, SkillRecommendation
+
+
+class Recommendations(NamedTuple):
+    skills: list  # SkillRecommendation, best first
+    courses: list  # CourseView, best first
+
+
+def _bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class RecommendationEngine:
+    def __init__(self, read_model, courses, max_skills=3, max_courses=3, cache_size=4096):
+        # Bit positions are only meaningful for the index they were encoded with
+        self.skill_index = read_model.skill_index
+        self.max_skills = max_skills
+        self.max_courses = max_courses
+        self.positions = [(p.min_cgpa, p.skills) for p in read_model.position_records() if p.skills]
+
+        self.totals = {}  # bit -> number of skill sets containing it
+        self.cooccurrence = {}  # bit -> {other bit -> number of skill sets containing both}
+        for mask in [s.skills for s in read_model.student_records()] + [skills for _, skills in self.positions]:
+            self._count(mask)
+
+        self.courses = []
+        for course in courses:
+            covered = tuple(sorted(safe_set_from_json(course.skills_covered)))
+            view = CourseView(course.id, course.name, course.platform, course.url, covered)
+            self.courses.append((view, self.skill_index.encode(covered)))
+
+        self.built_at = time.monotonic()
+        self._cache = {}
+        self._cache_size = cache_size
+
+    def _count(self, mask):
+        bits = list(_bits(mask))
+        for a in bits:
+            self.totals[a] = self.totals.get(a, 0) + 1
+            row = self.cooccurrence.setdefault(a, {})
+            for b in bits:
+                if a != b:
+                    row[b] = row.get(b, 0) + 1
+
+    def affinity(self, skills_mask, bit):
+        """Sum over the student's skills ``a`` of P(bit | a)"""
+        score = 0.0
+        for a in _bits(skills_mask):
+            total = self.totals.get(a)
+            if total:
+                score += self.cooccurrence[a].get(bit, 0) / total
+        return score
+
+    def recommend(self, skills, cgpa):
+        key = (frozenset(skills), cgpa)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._recommend(self.skill_index.encode(key[0]), cgpa or 0)
+            if len(self._cache) >= self._cache_size:
+                self._cache.clear()
+            self._cache[key] = result
+        return result
+
+    def _recommend(self, have, cgpa):
+        missing = []
+        for min_cgpa, required in self.positions:
+            if min_cgpa and cgpa < min_cgpa:
+                continue
+            if required & ~have:
+                missing.append(required & ~have)
+        if not missing:
+            return Recommendations([], [])
+
+        # Greedy set cover over the skills
+        chosen = 0
+        picks = []
+        while len(picks) < self.max_skills:
+            unlocks = {}
+            needed = {}
+            for gap in missing:
+                remaining = gap & ~chosen
+                if not remaining:
+                    continue
+                if remaining & (remaining - 1) == 0:
+                    bit = remaining.bit_length() - 1
+                    unlocks[bit] = unlocks.get(bit, 0) + 1
+                for bit in _bits(remaining):
+                    needed[bit] = needed.get(bit, 0) + 1
+            if not needed:
+                break
+            best = max(needed, key=lambda bit: (unlocks.get(bit, 0), needed[bit], self.affinity(have, bit), -bit))
+            chosen |= 1 << best
+            picks.append(SkillRecommendation(self.skill_index.names[best], unlocks.get(best, 0), needed[best]))
+
+        # Greedy set cover over the courses: the picked skills first, then anything else missing
+        target = chosen
+        wider = 0
+        for gap in missing:
+            wider |= gap
+        courses = []
+        available = list(self.courses)
+        while len(courses) < self.max_courses and available:
+            i, (view, covered) = max(
+                enumerate(available),
+                key=lambda item: ((item[1][1] & target).bit_count(), (item[1][1] & wider).bit_count(), -item[0])
+            )
+            if not covered & (target | wider):
+                break
+            courses.append(view)
+            target &= ~covered
+            wider &= ~covered
+            del available[i]
+
+        return Recommendations(picks, courses)
+
+
+def _inputs_version():
+    """Changes whenever the data an engine is built from does"""
+    courses = db.session.query(db.func.count(CourseSuggestion.id), db.func.max(CourseSuggestion.id)).one()
+    return get_read_model().seen_change, tuple(courses)
+
+
+def build_engine():
+    """Build a fresh engine from the current read model and course catalogue"""
+    version = _inputs_version()
+    courses = db.session.query(
+        CourseSuggestion.id, CourseSuggestion.name, CourseSuggestion.platform,
+        CourseSuggestion.url, CourseSuggestion.skills_covered
+    ).all()
+    engine = RecommendationEngine(
+        get_read_model(), courses,
+        max_skills=current_app.config['RECOMMENDER_MAX_SKILLS'],
+        max_courses=current_app.config['RECOMMENDER_MAX_COURSES'],
+    )
+    engine.version = version
+    return engine
+
+
+NO_RECOMMENDATIONS = Recommendations([], [])
+
+_build_lock = threading.Lock()
+
+def get_recommender():
+    """The app's engine, or None while this process is still building its first one"""
+    app = current_app._get_current_object()
+    _ensure_builder(app)
+    return app.extensions.get('recommender')
+
+
+def _ensure_builder(app):
+    # Threads do not survive a fork, so track which process started one
+    if app.extensions.get('recommender_builder') == os.getpid():
+        return
+    with _build_lock:
+        if app.extensions.get('recommender_builder') == os.getpid():
+            return
+        app.extensions['recommender_builder'] = os.getpid()
+        threading.Thread(target=_build_forever, args=(app,), name='recommender-build', daemon=True).start()
+
+
+def _build_forever(app):
+    interval = app.config['RECOMMENDER_REFRESH']
+    while True:
+        try:
+            with app.app_context():
+                current = app.extensions.get('recommender')
+                # Most refreshes find nothing new; skip the rebuild then
+                if current is None or current.version != _inputs_version():
+                    app.extensions['recommender'] = build_engine()
+        except Exception:
+            app.logger.exception('Building the recommendation engine failed')
+            if app.extensions.get('recommender') is None:
+                time.sleep(min(interval or 60, 60))
+                continue
+        if not interval:
+            return
+        # Jittered so the workers of one server do not all rebuild at once
+        time.sleep(interval * random.uniform(0.9, 1.1))
@@ -0,0 +1,171 @@
+"""Concurrency test for the write paths against a locally running server.
+
+Start the app first (``gunicorn -c gunicorn.conf.py wsgi:app``), then:
+
+    python scripts/concurrency_test.py --url http://127.0.0.1:8000 -c 16 --rounds 20
+
+Each round releases all threads at once on the same logical write:
+
+* ``register`` - every thread registers the same username/email;
+* ``apply``    - every thread applies the same student to the same position;
+* ``profile``  - every thread saves the first profile of the same new student.
+
+For each scenario it reports throughput, the status codes seen, the error
+rate (5xx or connection failures) and how many rounds ended with the wrong
+number of rows: exactly one account per register round, one application
+per apply round (checked through the position's pipeline API) and one
+profile per profile round (checked through the students CSV export; run the
+server with ``REPORTS_USE_SNAPSHOT=0`` so the export reads live data).
+"""
+import argparse
+import http.cookiejar
+import json
+import re
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from collections import Counter
+
+
+class NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+def make_opener(jar=None):
+    """Opener that keeps cookies but reports redirects instead of following them"""
+    jar = jar if jar is not None else http.cookiejar.CookieJar()
+    return urllib.request.build_opener(urllib.request.HTTPCookieProcessor(jar), NoRedirect()), jar
+
+
+def send(opener, url, form=None):
+    """Return ``(status, location, body)``; status 0 means the connection failed"""
+    data = urllib.parse.urlencode(form, doseq=True).encode() if form is not None else None
+    try:
+        with opener.open(url, data, timeout=60) as resp:
+            return resp.status, resp.headers.get('Location', ''), resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get('Location', ''), e.read()
+    except OSError:
+        return 0, '', b''
+
+
+def new_user(base_url, user_type):
+    """Register and log in a throwaway user; returns its cookie jar"""
+    opener, jar = make_opener()
+    name = f"conc_{user_type}_{uuid.uuid4().hex[:8]}"
+    send(opener, base_url + '/register', {'username': name, 'email': f'{name}@example.com', 'password': name, 'user_type': user_type})
+    send(opener, base_url + '/login', {'username': name, 'password': name})
+    return jar
+
+
+def student_form(name, college='Load College'):
+    return {'name': name, 'college': college, 'cgpa': '8.0',
+            'skills[]': ['Python', 'SQL'], 'courses[]': ['DBMS'], 'projects[]': ['p']}
+
+
+def hammer(concurrency, make_request):
+    """Run ``make_request(i)`` on every thread at once; returns the results in thread order"""
+    barrier = threading.Barrier(concurrency)
+    results = [None] * concurrency
+
+    def run(i):
+        barrier.wait()
+        results[i] = make_request(i)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def scenario_register(base_url, concurrency, rounds):
+    openers = [make_opener()[0] for _ in range(concurrency)]
+    statuses, bad_rounds = Counter(), 0
+    for _ in range(rounds):
+        name = f"race_{uuid.uuid4().hex[:8]}"
+        form = {'username': name, 'email': f'{name}@example.com', 'password': name, 'user_type': 'student'}
+        results = hammer(concurrency, lambda i: send(openers[i], base_url + '/register', form))
+        statuses.update(status for status, _, _ in results)
+        created = sum(1 for status, location, _ in results if status == 302 and location.endswith('/login'))
+        bad_rounds += created != 1
+    return statuses, bad_rounds
+
+
+def scenario_apply(base_url, concurrency, rounds):
+    company = make_opener(new_user(base_url, 'company'))[0]
+    send(company, base_url + '/company/profile', {'name': 'Race Co', 'description': '', 'min_cgpa': '',
+                                                  'required_skills[]': ['Python'], 'required_courses[]': []})
+    for i in range(rounds):
+        send(company, base_url + '/company/positions', {'title': f'Race {i}', 'required_skills[]': ['Python'],
+                                                        'required_courses[]': []})
+    _, _, body = send(company, base_url + '/company/positions')
+    position_ids = sorted({int(pid) for pid in re.findall(rb'/company/positions/(\d+)/applications', body)})[-rounds:]
+
+    jar = new_user(base_url, 'student')
+    send(make_opener(jar)[0], base_url + '/student/profile', student_form('Race Student'))
+    openers = [make_opener(jar)[0] for _ in range(concurrency)]
+
+    statuses, bad_rounds = Counter(), 0
+    for pid in position_ids:
+        results = hammer(concurrency, lambda i: send(openers[i], f'{base_url}/apply/{pid}', {}))
+        statuses.update(status for status, _, _ in results)
+        status, _, body = send(company, f'{base_url}/api/positions/{pid}/applications')
+        bad_rounds += status != 200 or json.loads(body)['total'] != 1
+    return statuses, bad_rounds
+
+
+def scenario_profile(base_url, concurrency, rounds):
+    statuses, colleges = Counter(), []
+    for _ in range(rounds):
+        jar = new_user(base_url, 'student')
+        openers = [make_opener(jar)[0] for _ in range(concurrency)]
+        college = f"race_{uuid.uuid4().hex[:8]}"
+        colleges.append(college)
+        results = hammer(concurrency, lambda i: send(openers[i], base_url + '/student/profile',
+                                                     student_form(f'Profile {i}', college)))
+        statuses.update(status for status, _, _ in results)
+
+    # Each round's student must end up with exactly one profile row
+    company = make_opener(new_user(base_url, 'company'))[0]
+    _, _, body = send(company, base_url + '/company/students/export')
+    rows = Counter(row.split(',')[4] for row in body.decode().splitlines()[1:])
+    return statuses, sum(1 for college in colleges if rows[college] != 1)
+
+
+SCENARIOS = {'register': scenario_register, 'apply': scenario_apply, 'profile': scenario_profile}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('scenarios', nargs='*', help=f"any of {', '.join(SCENARIOS)} (default: all)")
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('-c', '--concurrency', type=int, default=16, help='threads released together per round')
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+    base_url = args.url.rstrip('/')
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    for name in args.scenarios or list(SCENARIOS):
+        start = time.perf_counter()
+        statuses, bad_rounds = SCENARIOS[name](base_url, args.concurrency, args.rounds)
+        elapsed = time.perf_counter() - start
+        total = sum(statuses.values())
+        errors = sum(count for status, count in statuses.items() if status == 0 or status >= 500)
+        print(f"[{name}]")
+        print(f"  requests:    {total} ({args.concurrency} threads x {args.rounds} rounds)")
+        print(f"  throughput:  {total / elapsed:.1f} req/s")
+        print(f"  statuses:    {', '.join(f'{status}: {count}' for status, count in sorted(statuses.items()))}")
+        print(f"  errors:      {errors} ({(errors / total * 100) if total else 0:.1f}%)")
+        print(f"  bad rounds:  {bad_rounds}")
+
+
+if __name__ == '__main__':
+    main()
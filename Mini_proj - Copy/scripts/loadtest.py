@@ -0,0 +1,146 @@
+"""Simple load test against a locally running server.
+
+Start the app first (``gunicorn -c gunicorn.conf.py wsgi:app`` or
+``python app.py``), then:
+
+    python scripts/loadtest.py --url http://127.0.0.1:8000 -c 16 -n 2000 /student/dashboard
+
+Paths behind ``@login_required`` are fetched as a freshly registered user
+of the type given by ``--user-type``, one per thread, each with a profile
+so the dashboards render instead of redirecting to the profile form. Setup
+waits out the login throttle, so ``-c`` may exceed LOGIN_IP_BURST, and
+stops if any step does not land where it should. Redirects are not
+followed: anything but a 2xx counts as an error. Reports throughput,
+latency percentiles, the status codes seen and error counts.
+"""
+import argparse
+import http.cookiejar
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from collections import Counter
+
+
+class NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+PROFILES = {
+    'student': ('/student/profile', {'name': 'Load Student', 'college': 'Load College', 'cgpa': '8.0',
+                                     'skills[]': ['Python', 'SQL'], 'courses[]': ['DBMS'], 'projects[]': ['p']}),
+    'company': ('/company/profile', {'name': 'Load Co', 'description': '', 'min_cgpa': '',
+                                     'required_skills[]': ['Python'], 'required_courses[]': []}),
+}
+
+
+def post(opener, url, form, retries=30):
+    """POST ``form`` and return ``(status, location)``, waiting out 429/503 from the login throttle and hash pool"""
+    data = urllib.parse.urlencode(form, doseq=True).encode()
+    for _ in range(retries):
+        try:
+            with opener.open(url, data, timeout=60) as resp:
+                return resp.status, resp.headers.get('Location', '')
+        except urllib.error.HTTPError as e:
+            if e.code not in (429, 503):
+                return e.code, e.headers.get('Location', '')
+        time.sleep(1)
+    return 429, ''
+
+
+def make_opener(base_url, user_type):
+    """Register, log in and create the profile of a throwaway user; return an opener holding its session cookie"""
+    jar = http.cookiejar.CookieJar()
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(jar), NoRedirect())
+    if not user_type:
+        return opener
+
+    name = f"load_{user_type}_{uuid.uuid4().hex[:8]}"
+    steps = [
+        ('register', '/register', {'username': name, 'email': f'{name}@example.com', 'password': name, 'user_type': user_type}, '/login'),
+        ('login', '/login', {'username': name, 'password': name}, f'/{user_type}/dashboard'),
+        ('profile', *PROFILES[user_type], f'/{user_type}/dashboard'),
+    ]
+    for step, path, form, expected in steps:
+        status, location = post(opener, base_url + path, form)
+        if status != 302 or urllib.parse.urlsplit(location).path != expected:
+            raise SystemExit(f"{step} as {name} failed: got {status} {location or '(no redirect)'}, expected a redirect to {expected}")
+    return opener
+
+
+def worker(opener, urls, count, latencies, statuses, lock):
+    local_latencies = []
+    local_statuses = Counter()
+    for i in range(count):
+        url = urls[i % len(urls)]
+        start = time.perf_counter()
+        try:
+            with opener.open(url, timeout=30) as resp:
+                resp.read()
+                local_statuses[resp.status] += 1
+        except urllib.error.HTTPError as e:
+            # Redirects land here too: a bounce to /login or the profile form is not the page under test
+            local_statuses[e.code] += 1
+        except (urllib.error.URLError, OSError):
+            local_statuses[0] += 1
+        local_latencies.append(time.perf_counter() - start)
+
+    with lock:
+        latencies.extend(local_latencies)
+        statuses.update(local_statuses)
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='*', default=['/'])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('-c', '--concurrency', type=int, default=8)
+    parser.add_argument('-n', '--requests', type=int, default=1000, help='total requests across all threads')
+    parser.add_argument('--user-type', choices=['student', 'company'], default=None,
+                        help='log in as a new user of this type before sending requests')
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip('/')
+    urls = [base_url + path for path in args.paths]
+    per_thread = max(1, args.requests // args.concurrency)
+
+    latencies, statuses, lock = [], Counter(), threading.Lock()
+    threads = [
+        threading.Thread(target=worker, args=(make_opener(base_url, args.user_type), urls, per_thread, latencies, statuses, lock))
+        for _ in range(args.concurrency)
+    ]
+
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"requests:    {total} ({args.concurrency} threads)")
+    print(f"elapsed:     {elapsed:.2f}s")
+    print(f"throughput:  {total / elapsed:.1f} req/s")
+    errors = sum(count for status, count in statuses.items() if not 200 <= status < 300)
+    print(f"statuses:    {', '.join(f'{status}: {count}' for status, count in sorted(statuses.items()))}")
+    print(f"errors:      {errors} ({(errors / total * 100) if total else 0:.1f}%)")
+    if latencies:
+        print(f"latency avg: {statistics.mean(latencies) * 1000:.1f} ms")
+        for pct in (50, 95, 99):
+            print(f"latency p{pct}: {percentile(latencies, pct) * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""Compare memory and load time of the dashboard read model with the ORM path.
+
+Builds a throwaway SQLite database with N synthetic students (default
+100k) and positions, then measures:
+
+* memory held after loading (tracemalloc, measured in a separate pass
+  because tracing slows allocation-heavy code down considerably)
+  - ORM:        StudentProfile.query.all() + CompanyPosition.query.all()
+  - read model: ReadModel().load()  (column-only queries into __slots__ records)
+* time to score every student against one company, as company_dashboard does
+
+    python scripts/readmodel_bench.py --students 100000
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from extensions import db  # noqa: E402
+
+SKILLS = [f'Skill {i}' for i in range(300)]
+COURSES = [f'Course {i}' for i in range(80)]
+
+
+def populate(n_students, n_positions):
+    from models import StudentProfile, CompanyProfile, CompanyPosition
+
+    rng = random.Random(42)
+    db.session.execute(db.insert(CompanyProfile), [
+        {'id': 1, 'user_id': 1, 'name': 'Bench Co', 'min_cgpa': 6.0,
+         'required_skills': json.dumps(SKILLS[:5]), 'required_courses': json.dumps(COURSES[:2])}
+    ])
+    batch = []
+    for i in range(1, n_students + 1):
+        batch.append({
+            'user_id': i + 1, 'name': f'Student {i}', 'college': 'Bench College',
+            'cgpa': round(rng.uniform(5, 10), 2),
+            'skills': json.dumps(rng.sample(SKILLS, rng.randint(3, 12))),
+            'courses': json.dumps(rng.sample(COURSES, rng.randint(1, 5))),
+            'projects': json.dumps([f'Project {i}']),
+        })
+        if len(batch) == 5000:
+            db.session.execute(db.insert(StudentProfile), batch)
+            batch = []
+    if batch:
+        db.session.execute(db.insert(StudentProfile), batch)
+    db.session.execute(db.insert(CompanyPosition), [
+        {'company_id': 1, 'title': f'Position {i}', 'min_cgpa': rng.choice([None, 6.5, 7.5]),
+         'required_skills': json.dumps(rng.sample(SKILLS, 4)), 'required_courses': json.dumps(rng.sample(COURSES, 2))}
+        for i in range(n_positions)
+    ])
+    db.session.commit()
+
+
+def measure_memory(label, fn):
+    db.session.remove()
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<12} retained {current / 2**20:7.1f} MiB   peak {peak / 2**20:7.1f} MiB")
+    del result
+    db.session.remove()
+
+
+def measure_time(label, fn):
+    db.session.remove()
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    print(f"{label:<28} {time.perf_counter() - start:6.3f}s")
+    db.session.remove()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=100_000)
+    parser.add_argument('--positions', type=int, default=2_000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='readmodel_bench_')
+    try:
+        app = create_app({
+            'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(workdir, 'bench.db'),
+            'UPLOAD_FOLDER': os.path.join(workdir, 'uploads'),
+            'TEMPLATE_CACHE_DIR': None,
+        })
+        with app.app_context():
+            db.create_all()
+            populate(args.students, args.positions)
+            print(f"{args.students} students, {args.positions} positions")
+
+            from matching import calculate_student_company_match, safe_set_from_json
+            from models import StudentProfile, CompanyProfile, CompanyPosition
+            from readmodel import ReadModel
+
+            print('\nmemory after load')
+            measure_memory('ORM', lambda: (StudentProfile.query.all(), CompanyPosition.query.all()))
+            measure_memory('read model', lambda: ReadModel().load())
+
+            print('\nload time')
+            measure_time('ORM', lambda: (StudentProfile.query.all(), CompanyPosition.query.all()))
+            read_model = ReadModel()
+            measure_time('read model', read_model.load)
+
+            def score_orm():
+                company = db.session.get(CompanyProfile, 1)
+                return [m for m in (calculate_student_company_match(s, company) for s in StudentProfile.query.all())
+                        if m['match_percentage'] >= 50]
+
+            def score_read_model():
+                company = db.session.get(CompanyProfile, 1)
+                return read_model.match_students(safe_set_from_json(company.required_skills),
+                                                 safe_set_from_json(company.required_courses),
+                                                 company.min_cgpa, threshold=50)
+
+            print('\nscore all students for one company (per dashboard request)')
+            measure_time('ORM', score_orm)
+            measure_time('read model (already loaded)', score_read_model)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Measure cold-start cost: module import + create_app() + first request.
+
+Each sample runs in a fresh interpreter so nothing is shared between runs.
+Samples are taken with an empty Jinja bytecode cache ("cold") and with the
+cache already populated by a previous run ("warm").
+
+    python scripts/startup_bench.py -n 5
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r'''
+import json, sys, time
+t0 = time.perf_counter()
+from app import create_app
+t1 = time.perf_counter()
+app = create_app({'TEMPLATE_CACHE_DIR': sys.argv[1], 'PRECOMPILE_TEMPLATES': sys.argv[2] == '1'})
+t2 = time.perf_counter()
+resp = app.test_client().get(sys.argv[3])
+t3 = time.perf_counter()
+assert resp.status_code == 200, resp.status_code
+print(json.dumps({'import': t1 - t0, 'create_app': t2 - t1, 'first_request': t3 - t2}))
+'''
+
+
+def sample(cache_dir, precompile, path):
+    out = subprocess.run(
+        [sys.executable, '-c', CHILD, cache_dir, '1' if precompile else '0', path],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def report(label, samples):
+    print(f"{label}:")
+    for key in ('import', 'create_app', 'first_request'):
+        values = [s[key] * 1000 for s in samples]
+        print(f"  {key:<14} median {statistics.median(values):7.1f} ms   min {min(values):7.1f} ms")
+    totals = [sum(s.values()) * 1000 for s in samples]
+    print(f"  {'total':<14} median {statistics.median(totals):7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--runs', type=int, default=5)
+    parser.add_argument('--path', default='/login', help='page requested as the first request')
+    parser.add_argument('--precompile', action='store_true', help='compile all templates inside create_app()')
+    args = parser.parse_args()
+
+    cache_dir = tempfile.mkdtemp(prefix='jinja_bench_')
+    try:
+        cold = []
+        for _ in range(args.runs):
+            shutil.rmtree(cache_dir)
+            os.makedirs(cache_dir)
+            cold.append(sample(cache_dir, args.precompile, args.path))
+        warm = [sample(cache_dir, args.precompile, args.path) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    report('cold (empty bytecode cache)', cold)
+    report('warm (bytecode cache populated)', warm)
+
+
+if __name__ == '__main__':
+    main()
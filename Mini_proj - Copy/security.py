@@ -0,0 +1,107 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from flask import current_app
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, generate_password_hash, check_password_hash
+
+# --- Password Hashing & Login Throttling ---
+class HashingBusy(Exception):
+    """Raised when too many password hashes are already queued"""
+
+_hash_executor = None
+_hash_slots = None
+_hash_executor_lock = threading.Lock()
+
+def _submit_hashing(fn, *args, **kwargs):
+    """Run a slow hash function on the bounded pool and wait for its result"""
+    global _hash_executor, _hash_slots
+    if _hash_executor is None:
+        with _hash_executor_lock:
+            if _hash_executor is None:
+                workers = current_app.config['PASSWORD_HASH_WORKERS']
+                _hash_slots = threading.BoundedSemaphore(workers + current_app.config['PASSWORD_HASH_QUEUE'])
+                _hash_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pwhash')
+
+    if not _hash_slots.acquire(blocking=False):
+        raise HashingBusy()
+    future = _hash_executor.submit(fn, *args, **kwargs)
+    future.add_done_callback(lambda _: _hash_slots.release())
+    try:
+        return future.result(timeout=current_app.config['PASSWORD_HASH_TIMEOUT'])
+    except FutureTimeout:
+        # The hash still finishes in the background and frees its slot then
+        raise HashingBusy() from None
+
+def expand_hash_method(method):
+    """The full method string werkzeug stores for ``method``, e.g. 'scrypt' -> 'scrypt:32768:8:1'"""
+    name, *args = method.split(':')
+    if name == 'scrypt':
+        n, r, p = map(int, args) if args else (2**15, 8, 1)
+        return f'scrypt:{n}:{r}:{p}'
+    if name == 'pbkdf2':
+        hash_name = args[0] if args else 'sha256'
+        iterations = int(args[1]) if len(args) > 1 else DEFAULT_PBKDF2_ITERATIONS
+        return f'pbkdf2:{hash_name}:{iterations}'
+    raise ValueError(f"Unsupported PASSWORD_HASH_METHOD '{method}'")
+
+def hash_password(password):
+    return _submit_hashing(generate_password_hash, password, method=current_app.config['PASSWORD_HASH_METHOD'])
+
+def verify_password(password_hash, password):
+    if not password_hash:
+        return False
+    return _submit_hashing(check_password_hash, password_hash, password)
+
+class TokenBucket:
+    """In-memory token bucket keyed by client (IP address or username)"""
+
+    def __init__(self, capacity, rate, max_keys=10000):
+        self.capacity = capacity
+        self.rate = rate
+        self.max_keys = max_keys
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _level(self, key, now):
+        level, stamp = self._buckets.get(key, (self.capacity, now))
+        return min(self.capacity, level + (now - stamp) * self.rate)
+
+    def has(self, key, tokens=1):
+        """Whether ``consume(key, tokens)`` would succeed right now, without taking anything"""
+        with self._lock:
+            return self._level(key, time.monotonic()) >= tokens
+
+    def consume(self, key, tokens=1):
+        now = time.monotonic()
+        with self._lock:
+            level = self._level(key, now)
+            allowed = level >= tokens
+            self._buckets[key] = (level - tokens if allowed else level, now)
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+            return allowed
+
+    def _prune(self, now):
+        # Buckets that have refilled completely carry no state worth keeping
+        for key, (level, stamp) in list(self._buckets.items()):
+            if level + (now - stamp) * self.rate >= self.capacity:
+                del self._buckets[key]
+
+def init_app(app):
+    """Attach the login token buckets; the hashing pool itself starts on first use"""
+    expand_hash_method(app.config['PASSWORD_HASH_METHOD'])  # fail at startup, not on the first login
+    app.extensions['login_throttle'] = (
+        TokenBucket(app.config['LOGIN_IP_BURST'], app.config['LOGIN_IP_RATE']),
+        TokenBucket(app.config['LOGIN_USER_BURST'], app.config['LOGIN_USER_RATE']),
+    )
+
+def login_allowed(ip, username):
+    """Take a token from the per-IP bucket and check the failure bucket for this client and user"""
+    ip_bucket, user_bucket = current_app.extensions['login_throttle']
+    return ip_bucket.consume(ip) and user_bucket.has((ip, username))
+
+def login_failed(ip, username):
+    """Charge a failed password check; keyed on the client too, so nobody else can lock the account out"""
+    _, user_bucket = current_app.extensions['login_throttle']
+    user_bucket.consume((ip, username))
@@ -0,0 +1,124 @@
+"""Read routing for heavy reports.
+
+The candidate analysis and the CSV exports read whole tables. With
+REPORTS_USE_SNAPSHOT set they run against a copy of the SQLite database
+taken with the backup API instead of the file that serves writes:
+
+    <SNAPSHOT_PATH>          the current snapshot, opened read-only
+    <SNAPSHOT_PATH>.<pid>.tmp  a snapshot being written
+
+A new copy is written to a temp file and swapped in with os.replace, so a
+reader only ever sees a complete snapshot. The snapshot engine uses
+NullPool, so every report opens the file afresh and picks up the latest
+swap. Once the snapshot is older than SNAPSHOT_MAX_AGE a refresh is started
+in the background and reports keep using the old copy until it lands;
+``flask refresh-snapshot`` can also be run from cron. Without a snapshot,
+or on another database backend, reports read the live database.
+"""
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from extensions import db
+
+
+def snapshot_supported():
+    url = db.engine.url
+    return url.get_backend_name() == 'sqlite' and url.database not in (None, '', ':memory:')
+
+
+def snapshot_age(path):
+    """Seconds since the snapshot at ``path`` was taken, or None if there is none"""
+    try:
+        return max(0.0, time.time() - os.path.getmtime(path))
+    except OSError:
+        return None
+
+
+def refresh_snapshot():
+    """Copy the live database to SNAPSHOT_PATH; returns the path"""
+    path = current_app.config['SNAPSHOT_PATH']
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    source = db.engine.raw_connection()
+    try:
+        target = sqlite3.connect(tmp)
+        try:
+            # In WAL mode this only holds a read transaction, so writers carry on
+            source.driver_connection.backup(target)
+            # The copy inherits WAL mode; readers would then leave -wal/-shm files
+            # next to SNAPSHOT_PATH that outlive the swap below
+            target.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            target.close()
+    finally:
+        source.close()
+    os.replace(tmp, path)
+    return path
+
+
+_refreshing = threading.Lock()
+
+def _refresh_in_background(app):
+    if not _refreshing.acquire(blocking=False):
+        return  # one refresh per process at a time
+
+    def run():
+        try:
+            with app.app_context():
+                refresh_snapshot()
+        except Exception:
+            app.logger.exception('Refreshing the report snapshot failed')
+        finally:
+            _refreshing.release()
+
+    threading.Thread(target=run, name='report-snapshot', daemon=True).start()
+
+
+def _snapshot_engine(app):
+    engine = app.extensions.get('report_snapshot_engine')
+    if engine is None:
+        # Snapshots are replaced, never modified, so readers can skip locking entirely
+        uri = Path(app.config['SNAPSHOT_PATH']).absolute().as_uri() + '?mode=ro&immutable=1'
+        engine = create_engine('sqlite://', creator=lambda: sqlite3.connect(uri, uri=True), poolclass=NullPool)
+        app.extensions['report_snapshot_engine'] = engine
+    return engine
+
+
+@contextmanager
+def report_session():
+    """Yield ``(session, age)`` for a heavy read; ``age`` is None when reading the live database"""
+    app = current_app._get_current_object()
+    if not app.config['REPORTS_USE_SNAPSHOT'] or not snapshot_supported():
+        yield db.session, None
+        return
+
+    age = snapshot_age(app.config['SNAPSHOT_PATH'])
+    if age is None or age > app.config['SNAPSHOT_MAX_AGE']:
+        _refresh_in_background(app)
+    if age is None:
+        yield db.session, None
+        return
+
+    session = Session(_snapshot_engine(app))
+    try:
+        yield session, age
+    finally:
+        session.close()
+
+
+@click.command('refresh-snapshot')
+@with_appcontext
+def refresh_snapshot_command():
+    """Take a fresh copy of the database for reports."""
+    print(f'Snapshot written to {refresh_snapshot()}')
@@ -0,0 +1,165 @@
+"""Immutable view models handed to templates.
+
+JSON list columns are decoded once here, in the view layer, so templates
+never call json.loads while rendering a row.
+"""
+import json
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+def json_tuple(json_text):
+    """Decode a JSON list column into a tuple, empty on missing or bad data"""
+    try:
+        return tuple(json.loads(json_text)) if json_text else ()
+    except Exception:
+        return ()
+
+
+class StudentView(NamedTuple):
+    id: int
+    name: str
+    college: str
+    cgpa: float
+    skills: tuple
+    courses: tuple
+    projects: tuple
+    photo_path: Optional[str]
+
+    @classmethod
+    def from_model(cls, student):
+        return cls(
+            id=student.id,
+            name=student.name,
+            college=student.college,
+            cgpa=student.cgpa,
+            skills=json_tuple(student.skills),
+            courses=json_tuple(student.courses),
+            projects=json_tuple(student.projects),
+            photo_path=student.photo_path,
+        )
+
+
+class CompanyView(NamedTuple):
+    id: int
+    name: str
+    description: Optional[str]
+    min_cgpa: Optional[float]
+    required_skills: tuple
+    required_courses: tuple
+
+    @classmethod
+    def from_model(cls, company):
+        return cls(
+            id=company.id,
+            name=company.name,
+            description=company.description,
+            min_cgpa=company.min_cgpa,
+            required_skills=json_tuple(company.required_skills),
+            required_courses=json_tuple(company.required_courses),
+        )
+
+
+class PositionView(NamedTuple):
+    id: int
+    company_id: int
+    title: str
+    domain: Optional[str]
+    description: Optional[str]
+    min_cgpa: Optional[float]
+    required_skills: tuple
+    required_courses: tuple
+
+    @classmethod
+    def from_model(cls, position):
+        return cls(
+            id=position.id,
+            company_id=position.company_id,
+            title=position.title,
+            domain=position.domain,
+            description=position.description,
+            min_cgpa=position.min_cgpa,
+            required_skills=json_tuple(position.required_skills),
+            required_courses=json_tuple(position.required_courses),
+        )
+
+
+class CandidateView(NamedTuple):
+    """One row of a company's candidate list"""
+    student: StudentView
+    match_percentage: float
+    skills_percentage: float
+    courses_percentage: float
+    matched_skills: tuple
+    missing_skills: tuple
+    matched_courses: tuple
+    missing_courses: tuple
+    is_eligible: bool
+    total_required_skills: int
+    total_required_courses: int
+
+    @classmethod
+    def from_match(cls, match_data):
+        """Build from the dict returned by calculate_student_company_match"""
+        return cls(
+            student=StudentView.from_model(match_data['student']),
+            match_percentage=match_data['match_percentage'],
+            skills_percentage=match_data['skills_percentage'],
+            courses_percentage=match_data['courses_percentage'],
+            matched_skills=tuple(sorted(match_data['matched_skills'])),
+            missing_skills=tuple(sorted(match_data['missing_skills'])),
+            matched_courses=tuple(sorted(match_data['matched_courses'])),
+            missing_courses=tuple(sorted(match_data['missing_courses'])),
+            is_eligible=match_data['is_eligible'],
+            total_required_skills=match_data['total_required_skills'],
+            total_required_courses=match_data['total_required_courses'],
+        )
+
+
+class ApplicantView(NamedTuple):
+    """One application in a position's pipeline"""
+    application_id: int
+    status: str
+    match_percentage: Optional[float]
+    created_at: Optional[datetime]
+    missing_skills: tuple
+    student_id: int
+    name: str
+    college: str
+    cgpa: float
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            application_id=row.id,
+            status=row.status,
+            match_percentage=row.match_percentage,
+            created_at=row.created_at,
+            missing_skills=json_tuple(row.missing_skills),
+            student_id=row.student_id,
+            name=row.name,
+            college=row.college,
+            cgpa=row.cgpa,
+        )
+
+    def to_dict(self):
+        data = self._asdict()
+        data['created_at'] = self.created_at.isoformat() if self.created_at else None
+        data['missing_skills'] = list(self.missing_skills)
+        return data
+
+
+class CourseView(NamedTuple):
+    """A course suggestion with its covered skills decoded"""
+    id: int
+    name: str
+    platform: Optional[str]
+    url: Optional[str]
+    skills_covered: tuple
+
+
+class SkillRecommendation(NamedTuple):
+    """A skill worth learning next and what it opens up"""
+    skill: str
+    unlocks: int  # eligible positions fully covered once this skill is added to the ones before it
+    positions: int  # eligible positions that list this skill among the student's missing ones
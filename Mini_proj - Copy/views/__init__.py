@@ -0,0 +1,85 @@
+"""Blueprints for the main, student, company, position and export areas."""
+import time
+
+from flask import abort, current_app, g, jsonify, make_response, render_template, request
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+
+from extensions import db
+
+
+def render_timed(template_name, **context):
+    """render_template that records how long Jinja took for the Server-Timing header"""
+    start = time.perf_counter()
+    html = render_template(template_name, **context)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    g.render_ms = g.get('render_ms', 0.0) + elapsed_ms
+    current_app.logger.debug('rendered %s in %.1f ms', template_name, elapsed_ms)
+    return html
+
+
+def add_server_timing(response):
+    if 'render_ms' in g:
+        response.headers.add('Server-Timing', f"render;dur={g.render_ms:.1f}")
+    return response
+
+
+def _bad_request(error):
+    abort(make_response(jsonify({'error': error}), 400))
+
+
+def request_data():
+    """The form, or the JSON body when the request is JSON; a body that is not an object is a 400"""
+    if not request.is_json:
+        return request.form
+    data = request.get_json(silent=True)
+    if data is None:
+        return {}
+    if not isinstance(data, dict):
+        _bad_request('request body must be a JSON object')
+    return data
+
+
+def requested_ids(name):
+    """Integer ids from a JSON body list ``name`` or the repeated form field ``name[]``"""
+    if request.is_json:
+        values = request_data().get(name) or []
+        if not isinstance(values, list):
+            _bad_request(f'{name} must be a list of ids')
+    else:
+        values = request.form.getlist(name + '[]')
+    ids = []
+    for value in values:
+        try:
+            ids.append(int(value))
+        except (TypeError, ValueError):
+            continue
+    return list(dict.fromkeys(ids))
+
+
+def chunked(values, size=500):
+    """Split a list so IN (...) clauses stay under SQLite's parameter limit"""
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+# Backends with INSERT ... ON CONFLICT DO NOTHING
+CONFLICT_DIALECTS = {'sqlite': sqlite, 'postgresql': postgresql}
+
+
+def check_database_backend(app):
+    """Fail at startup, not on the first write, if the database cannot ignore insert conflicts"""
+    backend = make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name()
+    if backend not in CONFLICT_DIALECTS:
+        raise ValueError(f"Unsupported database backend '{backend}'; use one of {', '.join(CONFLICT_DIALECTS)}")
+
+
+def insert_ignoring_conflicts(model):
+    """INSERT ... ON CONFLICT DO NOTHING; the result's rowcount says whether rows went in.
+
+    Lets a unique constraint settle races between concurrent requests
+    instead of a check-then-insert that fails with IntegrityError.
+    """
+    dialect = CONFLICT_DIALECTS[db.engine.dialect.name]
+    # Built on the Table so that executemany returns a plain CursorResult with a rowcount
+    return dialect.insert(model.__table__).on_conflict_do_nothing()
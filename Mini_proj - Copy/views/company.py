@@ -0,0 +1,195 @@
+import json
+import os
+
+from flask import Blueprint, render_template, request, redirect, url_for, flash, send_file
+from flask_login import login_required, current_user
+
+from extensions import db
+from matching import calculate_student_company_match, get_company_candidate_analysis, safe_set_from_json
+from models import StudentProfile, CompanyProfile
+from readmodel import company_saved, get_read_model, load_in_chunks
+from snapshot import report_session
+from viewmodels import CandidateView, CompanyView
+from views import insert_ignoring_conflicts, render_timed
+
+bp = Blueprint('company', __name__)
+
+@bp.route('/company/profile', methods=['GET', 'POST'])
+@login_required
+def company_profile():
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+    
+    profile = current_user.company_profile
+    
+    if request.method == 'POST':
+        name = request.form['name']
+        description = request.form['description']
+        min_cgpa = float(request.form['min_cgpa']) if request.form['min_cgpa'] else None
+        required_skills = request.form.getlist('required_skills[]')
+        required_courses = request.form.getlist('required_courses[]')
+        
+        if not profile:
+            # Concurrent first saves race here; the unique user_id index keeps a single row
+            db.session.execute(insert_ignoring_conflicts(CompanyProfile).values(user_id=current_user.id, name=name))
+            profile = CompanyProfile.query.filter_by(user_id=current_user.id).one()
+
+        profile.name = name
+        profile.description = description
+        profile.min_cgpa = min_cgpa
+        profile.required_skills = json.dumps(required_skills)
+        profile.required_courses = json.dumps(required_courses)
+        
+        db.session.commit()
+        company_saved(profile)
+        flash('Profile updated successfully')
+        return redirect(url_for('company.company_dashboard'))
+    
+    # Prepopulate form data
+    form_data = {
+        'name': profile.name if profile else '',
+        'description': profile.description if profile else '',
+        'min_cgpa': profile.min_cgpa if profile else '',
+        'required_skills': json.loads(profile.required_skills) if profile and profile.required_skills else [],
+        'required_courses': json.loads(profile.required_courses) if profile and profile.required_courses else []
+    }
+    
+    return render_template('company_profile.html', form_data=form_data)
+
+@bp.route('/company/dashboard')
+@login_required
+def company_dashboard():
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+    
+    profile = current_user.company_profile
+    if not profile:
+        flash('Please complete your profile first')
+        return redirect(url_for('company.company_profile'))
+    
+    # Get positions for this company
+    positions = profile.positions
+
+    # Score every student on the compact read model, then load only the
+    # profiles that clear the display threshold
+    read_model = get_read_model()
+    required_skills = safe_set_from_json(profile.required_skills)
+    required_courses = safe_set_from_json(profile.required_courses)
+    student_ids = read_model.match_students(required_skills, required_courses, profile.min_cgpa, threshold=50)
+    students = load_in_chunks(StudentProfile.query, StudentProfile.id, student_ids)
+    
+    # Find eligible students using enhanced matching
+    eligible_students = []
+    
+    for student in students:
+        # Use enhanced matching function
+        match_data = calculate_student_company_match(student, profile)
+        
+        if match_data['match_percentage'] >= 50:  # Only show students with at least 50% match (for display purposes)
+            eligible_students.append(CandidateView.from_match(match_data))
+    
+    # Sort by match percentage (highest first)
+    eligible_students.sort(key=lambda x: x.match_percentage, reverse=True)
+    
+    # Analytics data
+    skill_distribution = read_model.skill_distribution()
+    
+    return render_timed('company_dashboard.html', profile=CompanyView.from_model(profile),
+                        eligible_students=eligible_students, skill_distribution=skill_distribution, positions=positions)
+
+@bp.route('/company/students')
+@login_required
+def company_students():
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+    students = StudentProfile.query.all()
+    rows = []
+    for s in students:
+        try:
+            skills = ', '.join(json.loads(s.skills)) if s.skills else ''
+        except Exception:
+            skills = ''
+        try:
+            courses = ', '.join(json.loads(s.courses)) if s.courses else ''
+        except Exception:
+            courses = ''
+        try:
+            projects = ', '.join(json.loads(s.projects)) if s.projects else ''
+        except Exception:
+            projects = ''
+
+        rows.append({
+            'id': s.id,
+            'username': s.user.username if s.user else '',
+            'email': s.user.email if s.user else '',
+            'name': s.name,
+            'college': s.college,
+            'cgpa': s.cgpa,
+            'skills': skills,
+            'courses': courses,
+            'projects': projects,
+            'has_profile': bool(s.resume_path or skills or courses or projects),
+        })
+    return render_timed('students_list.html', rows=rows)
+
+@bp.route('/student/resume/view/<int:student_id>')
+@login_required
+def student_resume_view(student_id):
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    profile = StudentProfile.query.get_or_404(student_id)
+    skills = json.loads(profile.skills) if profile.skills else []
+    courses = json.loads(profile.courses) if profile.courses else []
+    projects = json.loads(profile.projects) if profile.projects else []
+
+    summary_parts = []
+    if skills:
+        summary_parts.append(f"Skilled in {', '.join(skills[:6])}.")
+    if projects:
+        summary_parts.append(f"Completed {len(projects)} project(s) demonstrating practical experience.")
+    if courses:
+        summary_parts.append(f"Finished {len(courses)} relevant course(s).")
+    summary = ' '.join(summary_parts) or 'Motivated student seeking opportunities to apply and grow skills.'
+
+    form_data = {
+        'photo_filename': os.path.basename(profile.photo_path) if profile and profile.photo_path else None
+    }
+    return render_template('resume.html', profile=profile, skills=skills, courses=courses, projects=projects, summary=summary, form_data=form_data)
+
+@bp.route('/student/resume/<int:student_id>')
+@login_required
+def view_resume(student_id):
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+    
+    student = StudentProfile.query.get_or_404(student_id)
+    if student.resume_path and os.path.exists(student.resume_path):
+        return send_file(student.resume_path)
+    else:
+        flash('Resume not available')
+        return redirect(url_for('company.company_dashboard'))
+
+@bp.route('/company/<int:company_id>/candidates')
+@login_required
+def company_candidates_analysis(company_id):
+    """Detailed candidate analysis for a specific company"""
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+    
+    # Full-table read: served from the report snapshot when one is configured
+    with report_session() as (session, snapshot_age):
+        analysis = get_company_candidate_analysis(company_id, session)
+        if not analysis:
+            flash('Company not found')
+            return redirect(url_for('company.company_dashboard'))
+        
+        analysis['company'] = CompanyView.from_model(analysis['company'])
+        analysis['candidates'] = [CandidateView.from_match(c) for c in analysis['candidates']]
+    return render_timed('company_candidates.html', analysis=analysis, snapshot_age=snapshot_age)
@@ -0,0 +1,136 @@
+import csv
+import json
+from io import StringIO
+
+from flask import Blueprint, Response, redirect, url_for, flash
+from flask_login import login_required, current_user
+from sqlalchemy.orm import joinedload
+
+from extensions import db
+from matching import compute_position_match
+from models import StudentProfile, CompanyPosition, Application
+from snapshot import report_session
+
+bp = Blueprint('export', __name__)
+
+@bp.route('/company/students/export')
+@login_required
+def company_students_export():
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    output = StringIO()
+    writer = csv.writer(output)
+    writer.writerow(['id', 'username', 'email', 'name', 'college', 'cgpa', 'skills', 'courses', 'projects'])
+
+    with report_session() as (session, snapshot_age):
+        for s in session.query(StudentProfile).options(joinedload(StudentProfile.user)):
+            skills = ', '.join(json.loads(s.skills)) if s.skills else ''
+            courses = ', '.join(json.loads(s.courses)) if s.courses else ''
+            projects = ', '.join(json.loads(s.projects)) if s.projects else ''
+            username = s.user.username if s.user else ''
+            email = s.user.email if s.user else ''
+            writer.writerow([s.id, username, email, s.name, s.college, s.cgpa, skills, courses, projects])
+
+    return _csv_response(output, 'students.csv', snapshot_age)
+
+
+def _csv_response(output, filename, snapshot_age):
+    resp = Response(output.getvalue(), mimetype='text/csv')
+    resp.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    if snapshot_age is not None:
+        resp.headers['X-Snapshot-Age'] = str(int(snapshot_age))
+    return resp
+
+@bp.route('/student/matches/export')
+@login_required
+def export_student_matches():
+    """Export student's matches to CSV file"""
+    if current_user.user_type != 'student':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+    
+    profile = current_user.student_profile
+    if not profile:
+        flash('Please complete your profile first')
+        return redirect(url_for('student.student_profile'))
+    
+    # Calculate matches using enhanced matching
+    matches = []
+    student_skills = set(json.loads(profile.skills)) if profile.skills else set()
+    student_courses = set(json.loads(profile.courses)) if profile.courses else set()
+    
+    # Full-table read: served from the report snapshot when one is configured
+    with report_session() as (session, snapshot_age):
+        positions = session.query(CompanyPosition).options(joinedload(CompanyPosition.company)).all()
+        # The student's own applications are a small indexed read; take them live so
+        # an export right after applying is not behind the snapshot
+        applied_ids = {row.position_id for row in
+                       db.session.query(Application.position_id).filter_by(student_id=profile.id)}
+
+        for pos in positions:
+            company = pos.company
+            # Check if student meets minimum CGPA requirement for position (fallback to company if position not set)
+            min_required = pos.min_cgpa if pos.min_cgpa is not None else (company.min_cgpa if company else None)
+            if min_required and profile.cgpa < min_required:
+                continue
+
+            # Use enhanced matching function
+            metrics = compute_position_match(student_skills, student_courses, pos)
+            matched_skills = metrics['matched_skills']
+            missing_skills = metrics['missing_skills']
+            match_percentage = metrics['match_percentage']
+            is_eligible = metrics['is_eligible']
+            skills_score = metrics['skills_score']
+            courses_score = metrics['courses_score']
+
+            has_applied = pos.id in applied_ids
+
+            if match_percentage >= 30:  # show reasonable matches
+                matches.append({
+                    'company_name': company.name,
+                    'company_description': company.description,
+                    'title': pos.title,
+                    'domain': pos.domain,
+                    'match_percentage': round(match_percentage),
+                    'missing_skills': list(missing_skills),
+                    'matched_skills': list(matched_skills),
+                    'has_applied': has_applied,
+                    'is_eligible': is_eligible,
+                    'skills_score': skills_score,
+                    'courses_score': courses_score
+                })
+    
+    # Sort by match percentage (highest first)
+    matches.sort(key=lambda x: x['match_percentage'], reverse=True)
+    
+    # Create CSV content
+    output = StringIO()
+    writer = csv.writer(output)
+    
+    # Write header
+    writer.writerow([
+        'Company Name', 'Position Title', 'Domain', 'Match Percentage', 
+        'Skills Score', 'Courses Score', 'Eligible', 'Applied', 
+        'Matched Skills', 'Missing Skills', 'Company Description'
+    ])
+    
+    # Write data rows
+    for match in matches:
+        writer.writerow([
+            match['company_name'],
+            match['title'],
+            match['domain'] or '',
+            f"{match['match_percentage']}%",
+            f"{match['skills_score']}%",
+            f"{match['courses_score']}%",
+            'Yes' if match['is_eligible'] else 'No',
+            'Yes' if match['has_applied'] else 'No',
+            ', '.join(match['matched_skills']),
+            ', '.join(match['missing_skills']),
+            match['company_description'] or ''
+        ])
+    
+    # Create response
+    return _csv_response(output, f'student_matches_{profile.name.replace(" ", "_")}.csv', snapshot_age)
@@ -0,0 +1,99 @@
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, send_from_directory
+from flask_login import login_user, login_required, logout_user
+
+from extensions import db
+from models import User
+from security import HashingBusy, hash_password, login_allowed, login_failed
+from views import insert_ignoring_conflicts
+
+bp = Blueprint('main', __name__)
+
+@bp.route('/')
+def index():
+    return render_template('index.html')
+
+@bp.route('/register', methods=['GET', 'POST'])
+def register():
+    if request.method == 'POST':
+        username = request.form['username']
+        email = request.form['email']
+        password = request.form['password']
+        user_type = request.form['user_type']
+        
+        # Answer the common case before paying for a password hash
+        taken = _registration_conflict(username, email)
+        if taken:
+            flash(taken)
+            return redirect(url_for('main.register'))
+        
+        try:
+            password_hash = hash_password(password)
+        except HashingBusy:
+            flash('The server is busy right now. Please try again in a few seconds.')
+            return render_template('register.html'), 503
+        # Concurrent sign-ups with the same name or email are settled by the unique constraints
+        result = db.session.execute(insert_ignoring_conflicts(User).values(
+            username=username, email=email, password_hash=password_hash, user_type=user_type
+        ))
+        db.session.commit()
+        if not result.rowcount:
+            flash(_registration_conflict(username, email) or 'Username or email already registered')
+            return redirect(url_for('main.register'))
+        
+        flash('Registration successful. Please log in.')
+        return redirect(url_for('main.login'))
+    
+    return render_template('register.html')
+
+def _registration_conflict(username, email):
+    """Flash message for whichever of username/email is already taken, or None"""
+    if User.query.filter_by(username=username).first():
+        return 'Username already exists'
+    if User.query.filter_by(email=email).first():
+        return 'Email already registered'
+    return None
+
+@bp.route('/login', methods=['GET', 'POST'])
+def login():
+    if request.method == 'POST':
+        username = request.form['username']
+        password = request.form['password']
+
+        client = request.remote_addr or 'unknown'
+        if not login_allowed(client, username.lower()):
+            flash('Too many login attempts. Please wait a moment and try again.')
+            return render_template('login.html'), 429
+
+        user = User.query.filter_by(username=username).first()
+        
+        try:
+            authenticated = user is not None and user.check_password(password)
+            if authenticated and user.needs_rehash():
+                user.set_password(password)
+                db.session.commit()
+        except HashingBusy:
+            flash('The server is busy right now. Please try again in a few seconds.')
+            return render_template('login.html'), 503
+
+        if authenticated:
+            login_user(user)
+            next_page = request.args.get('next')
+            if user.user_type == 'student':
+                return redirect(next_page or url_for('student.student_dashboard'))
+            else:
+                return redirect(next_page or url_for('company.company_dashboard'))
+        else:
+            login_failed(client, username.lower())
+            flash('Invalid username or password')
+    
+    return render_template('login.html')
+
+@bp.route('/logout')
+@login_required
+def logout():
+    logout_user()
+    return redirect(url_for('main.index'))
+
+@bp.route('/uploads/<path:filename>')
+def uploaded_file(filename):
+    return send_from_directory(current_app.config['UPLOAD_FOLDER'], filename)
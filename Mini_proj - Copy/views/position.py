@@ -0,0 +1,269 @@
+import json
+from datetime import datetime
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify
+from flask_login import login_required, current_user
+from sqlalchemy import func
+
+from analytics import delete_applications
+from extensions import db
+from matching import compute_position_match
+from models import APPLICATION_STATUSES, CompanyPosition, Application, StudentProfile
+from readmodel import position_deleted, position_saved
+from viewmodels import ApplicantView, PositionView
+from views import chunked, render_timed, request_data, requested_ids
+
+bp = Blueprint('position', __name__)
+
+@bp.route('/company/positions', methods=['GET', 'POST'])
+@login_required
+def company_positions():
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    profile = current_user.company_profile
+    if not profile:
+        flash('Please complete your profile first')
+        return redirect(url_for('company.company_profile'))
+
+    if request.method == 'POST':
+        title = request.form['title']
+        domain = request.form.get('domain', '')
+        description = request.form.get('description', '')
+        min_cgpa = float(request.form['min_cgpa']) if request.form.get('min_cgpa') else None
+        required_skills = request.form.getlist('required_skills[]')
+        required_courses = request.form.getlist('required_courses[]')
+
+        position = CompanyPosition(
+            company_id=profile.id,
+            title=title,
+            domain=domain,
+            description=description,
+            required_skills=json.dumps(required_skills),
+            required_courses=json.dumps(required_courses),
+            min_cgpa=min_cgpa
+        )
+        db.session.add(position)
+        db.session.commit()
+        position_saved(position)
+        flash('Position saved')
+        return redirect(url_for('position.company_positions'))
+
+    positions = CompanyPosition.query.filter_by(company_id=profile.id).all()
+    positions = [PositionView.from_model(p) for p in positions]
+    return render_timed('company_positions.html', profile=profile, positions=positions)
+
+@bp.route('/company/positions/delete/<int:position_id>', methods=['POST'])
+@login_required
+def delete_company_position(position_id):
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+    position = CompanyPosition.query.get_or_404(position_id)
+    profile = current_user.company_profile
+    if not profile or position.company_id != profile.id:
+        flash('Not authorized')
+        return redirect(url_for('position.company_positions'))
+    # Position ids can be reused by SQLite, so its applications must go with it
+    delete_applications(Application.position_id == position.id)
+    db.session.delete(position)
+    db.session.commit()
+    position_deleted(position_id)
+    flash('Position deleted')
+    return redirect(url_for('position.company_positions'))
+
+def _position_pipeline(position, status=None, min_match=None, page=1):
+    """Per-status counts plus one page of applicants ranked by stored match percentage.
+
+    Both queries are answered from the (position_id, status, match_percentage)
+    and (position_id, match_percentage) indexes on Application.
+    """
+    per_page = current_app.config['PIPELINE_PAGE_SIZE']
+    counts = dict(
+        db.session.query(Application.status, func.count(Application.id))
+        .filter(Application.position_id == position.id)
+        .group_by(Application.status)
+    )
+
+    query = db.session.query(
+        Application.id, Application.status, Application.match_percentage, Application.created_at,
+        Application.missing_skills, Application.student_id,
+        StudentProfile.name, StudentProfile.college, StudentProfile.cgpa
+    ).join(StudentProfile, StudentProfile.id == Application.student_id) \
+        .filter(Application.position_id == position.id)
+    if status:
+        query = query.filter(Application.status == status)
+    if min_match is not None:
+        query = query.filter(Application.match_percentage >= min_match)
+
+    # Fetch one extra row to know whether there is a next page without a COUNT(*)
+    rows = query.order_by(Application.match_percentage.desc(), Application.id) \
+        .limit(per_page + 1).offset((page - 1) * per_page).all()
+
+    return {
+        'position': PositionView.from_model(position),
+        'counts': {s: counts.get(s, 0) for s in APPLICATION_STATUSES},
+        'total': sum(counts.values()),
+        'applicants': [ApplicantView.from_row(row) for row in rows[:per_page]],
+        'page': page,
+        'has_next': len(rows) > per_page,
+        'status': status,
+        'min_match': min_match,
+    }
+
+def _owned_position_or_none(position_id):
+    position = CompanyPosition.query.get_or_404(position_id)
+    profile = current_user.company_profile
+    if not profile or position.company_id != profile.id:
+        return None
+    return position
+
+def _pipeline_filters():
+    status = request.args.get('status') or None
+    if status not in APPLICATION_STATUSES:
+        status = None
+    min_match = request.args.get('min_match', type=float)
+    page = max(request.args.get('page', 1, type=int), 1)
+    return status, min_match, page
+
+@bp.route('/company/positions/<int:position_id>/applications')
+@login_required
+def position_applications(position_id):
+    """Recruiter pipeline: applications received for one position"""
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    position = _owned_position_or_none(position_id)
+    if not position:
+        flash('Not authorized')
+        return redirect(url_for('position.company_positions'))
+
+    pipeline = _position_pipeline(position, *_pipeline_filters())
+    return render_timed('position_applications.html', pipeline=pipeline, statuses=APPLICATION_STATUSES)
+
+@bp.route('/api/positions/<int:position_id>/applications')
+@login_required
+def position_applications_api(position_id):
+    """JSON version of the pipeline view; same filters (status, min_match, page)"""
+    if current_user.user_type != 'company':
+        return jsonify({'error': 'access denied'}), 403
+
+    position = _owned_position_or_none(position_id)
+    if not position:
+        return jsonify({'error': 'not authorized'}), 403
+
+    pipeline = _position_pipeline(position, *_pipeline_filters())
+    return jsonify({
+        'position_id': position.id,
+        'title': position.title,
+        'counts': pipeline['counts'],
+        'total': pipeline['total'],
+        'page': pipeline['page'],
+        'has_next': pipeline['has_next'],
+        'applicants': [a.to_dict() for a in pipeline['applicants']],
+    })
+
+@bp.route('/company/applications/status', methods=['POST'])
+@login_required
+def update_application_status():
+    """Move many applications to a new status with set-based UPDATEs in one transaction.
+
+    Targets either an explicit list of ``application_ids`` or, with
+    ``scope=position``, every application for ``position_id`` (optionally only
+    those currently in ``from_status``). Applications for other companies'
+    positions are never touched.
+    """
+    if current_user.user_type != 'company':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    profile = current_user.company_profile
+    if not profile:
+        flash('Please complete your profile first')
+        return redirect(url_for('company.company_profile'))
+
+    data = request_data()
+    status = data.get('status')
+    from_status = data.get('from_status') or None
+    scope = data.get('scope', 'selected')
+    try:
+        position_id = int(data['position_id']) if data.get('position_id') else None
+    except (TypeError, ValueError):
+        position_id = None
+    application_ids = requested_ids('application_ids')
+
+    error = None
+    if status not in APPLICATION_STATUSES or (from_status and from_status not in APPLICATION_STATUSES):
+        error = 'Unknown application status'
+    elif len(application_ids) > current_app.config['BATCH_MAX_ITEMS']:
+        error = 'Too many applications selected at once'
+    elif not application_ids and not (scope == 'position' and position_id is not None):
+        error = 'No applications selected'
+    if error:
+        if request.is_json:
+            return jsonify({'error': error}), 400
+        flash(error)
+        if position_id is not None:
+            return redirect(url_for('position.position_applications', position_id=position_id))
+        return redirect(url_for('position.company_positions'))
+
+    own_positions = db.select(CompanyPosition.id).where(CompanyPosition.company_id == profile.id)
+    updated = 0
+    if scope != 'position':
+        for chunk in chunked(application_ids):
+            updated += Application.query.filter(
+                Application.id.in_(chunk),
+                Application.position_id.in_(own_positions)
+            ).update({'status': status, 'updated_at': datetime.utcnow()}, synchronize_session=False)
+    else:
+        query = Application.query.filter(
+            Application.position_id == position_id,
+            Application.position_id.in_(own_positions)
+        )
+        if from_status:
+            query = query.filter(Application.status == from_status)
+        updated = query.update({'status': status, 'updated_at': datetime.utcnow()}, synchronize_session=False)
+    db.session.commit()
+
+    if request.is_json:
+        return jsonify({'updated': updated, 'status': status})
+    flash(f'{updated} application(s) marked as {status}')
+    if position_id is not None:
+        return redirect(url_for('position.position_applications', position_id=position_id))
+    return redirect(url_for('position.company_positions'))
+
+@bp.route('/position/<int:position_id>')
+@login_required
+def view_position_details(position_id):
+    """Display detailed information about a specific position including required skills"""
+    position = CompanyPosition.query.get_or_404(position_id)
+    company = position.company
+    
+    # Parse required skills and courses
+    required_skills = json.loads(position.required_skills) if position.required_skills else []
+    required_courses = json.loads(position.required_courses) if position.required_courses else []
+    
+    # If user is a student, calculate their match with this position
+    match_info = None
+    if current_user.user_type == 'student':
+        profile = current_user.student_profile
+        if profile:
+            student_skills = set(json.loads(profile.skills)) if profile.skills else set()
+            student_courses = set(json.loads(profile.courses)) if profile.courses else set()
+            match_info = compute_position_match(student_skills, student_courses, position)
+            
+            # Check if student has already applied
+            existing_application = Application.query.filter_by(
+                student_id=profile.id, 
+                position_id=position.id
+            ).first()
+            match_info['has_applied'] = existing_application is not None
+    
+    return render_template('position_details.html', 
+                         position=position, 
+                         company=company,
+                         required_skills=required_skills,
+                         required_courses=required_courses,
+                         match_info=match_info)
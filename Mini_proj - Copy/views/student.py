@@ -0,0 +1,256 @@
+import json
+import os
+
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, jsonify
+from flask_login import login_required, current_user
+from sqlalchemy.orm import joinedload
+from werkzeug.utils import secure_filename
+
+from extensions import db
+from matching import compute_position_match
+from models import StudentProfile, CompanyPosition, Application
+from readmodel import get_read_model, load_in_chunks, student_saved
+from recommendations import NO_RECOMMENDATIONS, get_recommender
+from viewmodels import StudentView
+from views import insert_ignoring_conflicts, render_timed, requested_ids
+
+bp = Blueprint('student', __name__)
+
+@bp.route('/student/profile', methods=['GET', 'POST'])
+@login_required
+def student_profile():
+    if current_user.user_type != 'student':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+    
+    profile = current_user.student_profile
+    
+    if request.method == 'POST':
+        name = request.form['name']
+        college = request.form['college']
+        cgpa = float(request.form['cgpa'])
+        skills = request.form.getlist('skills[]')
+        courses = request.form.getlist('courses[]')
+        projects = request.form.getlist('projects[]')
+        
+        # Handle resume upload
+        resume = request.files.get('resume')
+        resume_path = None
+        if resume and resume.filename:
+            filename = secure_filename(f"{current_user.id}_{resume.filename}")
+            resume_path = os.path.join(current_app.config['UPLOAD_FOLDER'], filename)
+            resume.save(resume_path)
+
+        # Handle profile photo upload (png/jpg/jpeg)
+        photo = request.files.get('photo')
+        photo_path = None
+        if photo and photo.filename:
+            photo_filename = secure_filename(f"{current_user.id}_photo_{photo.filename}")
+            photo_path = os.path.join(current_app.config['UPLOAD_FOLDER'], photo_filename)
+            photo.save(photo_path)
+        
+        if not profile:
+            # Concurrent first saves race here; the unique user_id index keeps a single row
+            db.session.execute(insert_ignoring_conflicts(StudentProfile).values(
+                user_id=current_user.id, name=name, college=college, cgpa=cgpa
+            ))
+            profile = StudentProfile.query.filter_by(user_id=current_user.id).one()
+
+        profile.name = name
+        profile.college = college
+        profile.cgpa = cgpa
+        profile.skills = json.dumps(skills)
+        profile.courses = json.dumps(courses)
+        profile.projects = json.dumps(projects)
+        if resume_path:
+            profile.resume_path = resume_path
+        if photo_path:
+            profile.photo_path = photo_path
+        
+        db.session.commit()
+        student_saved(profile)
+        flash('Profile updated successfully')
+        return redirect(url_for('student.student_dashboard'))
+    
+    # Prepopulate form data
+    form_data = {
+        'name': profile.name if profile else '',
+        'college': profile.college if profile else '',
+        'cgpa': profile.cgpa if profile else '',
+        'skills': json.loads(profile.skills) if profile and profile.skills else [],
+        'courses': json.loads(profile.courses) if profile and profile.courses else [],
+        'projects': json.loads(profile.projects) if profile and profile.projects else [],
+        'photo_filename': os.path.basename(profile.photo_path) if profile and profile.photo_path else None
+    }
+    
+    return render_template('student_profile.html', form_data=form_data)
+
+@bp.route('/student/dashboard')
+@login_required
+def student_dashboard():
+    if current_user.user_type != 'student':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+    
+    profile = current_user.student_profile
+    if not profile:
+        flash('Please complete your profile first')
+        return redirect(url_for('student.student_profile'))
+    
+    # Calculate matches using enhanced matching
+    matches = []
+    student_skills = set(json.loads(profile.skills)) if profile.skills else set()
+    student_courses = set(json.loads(profile.courses)) if profile.courses else set()
+
+    # The read model applies the CGPA and score cut-offs over compact records,
+    # so only positions that will actually be shown are loaded as ORM objects.
+    position_ids = get_read_model().match_positions(student_skills, student_courses, profile.cgpa, threshold=30)
+    positions = load_in_chunks(CompanyPosition.query.options(joinedload(CompanyPosition.company)),
+                               CompanyPosition.id, position_ids)
+    applied_ids = {row.position_id for row in
+                   db.session.query(Application.position_id).filter_by(student_id=profile.id)}
+    
+    for pos in positions:
+        company = pos.company
+
+        # Use enhanced matching function
+        metrics = compute_position_match(student_skills, student_courses, pos)
+        matched_skills = metrics['matched_skills']
+        missing_skills = metrics['missing_skills']
+        match_percentage = metrics['match_percentage']
+        is_eligible = metrics['is_eligible']
+        skills_score = metrics['skills_score']
+        courses_score = metrics['courses_score']
+
+        has_applied = pos.id in applied_ids
+
+        if match_percentage >= 30:  # show reasonable matches
+            matches.append({
+                'company': company,
+                'position': pos,
+                'match_percentage': round(match_percentage),
+                'missing_skills': list(missing_skills),
+                'matched_skills': list(matched_skills),
+                'has_applied': has_applied,
+                'is_eligible': is_eligible,
+                'skills_score': skills_score,
+                'courses_score': courses_score
+            })
+    
+    # Sort by match percentage (highest first)
+    matches.sort(key=lambda x: x['match_percentage'], reverse=True)
+    
+    # Skills to learn next and courses covering them, from the precomputed engine
+    engine = get_recommender()
+    recommendations = engine.recommend(student_skills, profile.cgpa) if engine else NO_RECOMMENDATIONS
+    
+    return render_timed('student_dashboard.html', profile=StudentView.from_model(profile), matches=matches,
+                        recommended_skills=recommendations.skills, suggested_courses=recommendations.courses)
+
+@bp.route('/apply/<int:position_id>', methods=['POST'])
+@login_required
+def apply_position(position_id):
+    if current_user.user_type != 'student':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    position = CompanyPosition.query.get_or_404(position_id)
+    profile = current_user.student_profile
+    if not profile:
+        flash('Please complete your profile first')
+        return redirect(url_for('student.student_profile'))
+
+    student_skills = set(json.loads(profile.skills)) if profile.skills else set()
+    student_courses = set(json.loads(profile.courses)) if profile.courses else set()
+    # The (student_id, position_id) unique constraint settles double clicks
+    result = db.session.execute(insert_ignoring_conflicts(Application).values(
+        **_application_values(profile, student_skills, student_courses, position)
+    ))
+    db.session.commit()
+    if result.rowcount:
+        flash('Application submitted')
+    else:
+        flash('You have already applied for this position')
+    return redirect(url_for('student.student_dashboard'))
+
+@bp.route('/apply/batch', methods=['POST'])
+@login_required
+def apply_positions_batch():
+    """Apply to several positions at once; positions already applied to are skipped"""
+    if current_user.user_type != 'student':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    profile = current_user.student_profile
+    if not profile:
+        flash('Please complete your profile first')
+        return redirect(url_for('student.student_profile'))
+
+    position_ids = requested_ids('position_ids')
+    if len(position_ids) > current_app.config['BATCH_MAX_ITEMS']:
+        if request.is_json:
+            return jsonify({'error': 'too many positions'}), 400
+        flash('Too many positions selected at once')
+        return redirect(url_for('student.student_dashboard'))
+
+    # One query for the positions and one INSERT; positions already applied to
+    # are dropped by the unique constraint rather than a separate lookup
+    positions = load_in_chunks(CompanyPosition.query, CompanyPosition.id, position_ids)
+    student_skills = set(json.loads(profile.skills)) if profile.skills else set()
+    student_courses = set(json.loads(profile.courses)) if profile.courses else set()
+    rows = [_application_values(profile, student_skills, student_courses, position) for position in positions]
+    applied = 0
+    if rows:
+        applied = db.session.execute(insert_ignoring_conflicts(Application), rows).rowcount
+        db.session.commit()
+
+    if request.is_json:
+        return jsonify({'applied': applied, 'skipped': len(position_ids) - applied})
+    if applied:
+        flash(f'Applied to {applied} position(s)')
+    else:
+        flash('No new applications submitted')
+    return redirect(url_for('student.student_dashboard'))
+
+def _application_values(profile, student_skills, student_courses, position):
+    """Column values for a new Application, with the match computed at apply time"""
+    metrics = compute_position_match(student_skills, student_courses, position)
+    return {
+        'student_id': profile.id,
+        'position_id': position.id,
+        'status': 'applied',
+        'match_percentage': metrics['match_percentage'],
+        'matched_skills': json.dumps(list(metrics['matched_skills'])),
+        'missing_skills': json.dumps(list(metrics['missing_skills'])),
+    }
+
+@bp.route('/student/resume/generate')
+@login_required
+def generate_resume():
+    if current_user.user_type != 'student':
+        flash('Access denied')
+        return redirect(url_for('main.index'))
+
+    profile = current_user.student_profile
+    if not profile:
+        flash('Please complete your profile first')
+        return redirect(url_for('student.student_profile'))
+
+    skills = json.loads(profile.skills) if profile.skills else []
+    courses = json.loads(profile.courses) if profile.courses else []
+    projects = json.loads(profile.projects) if profile.projects else []
+
+    # Simple AI-like summary generation
+    summary_parts = []
+    if skills:
+        summary_parts.append(f"Skilled in {', '.join(skills[:6])}.")
+    if projects:
+        summary_parts.append(f"Completed {len(projects)} project(s) demonstrating practical experience.")
+    if courses:
+        summary_parts.append(f"Finished {len(courses)} relevant course(s).")
+    summary = ' '.join(summary_parts) or 'Motivated student seeking opportunities to apply and grow skills.'
+
+    form_data = {
+        'photo_filename': os.path.basename(profile.photo_path) if profile and profile.photo_path else None
+    }
+    return render_template('resume.html', profile=profile, skills=skills, courses=courses, projects=projects, summary=summary, form_data=form_data)
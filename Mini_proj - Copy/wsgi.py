@@ -0,0 +1,10 @@
+"""WSGI entry point: ``gunicorn -c gunicorn.conf.py wsgi:app``
+
+Run ``flask --app app init-db`` once before starting workers; the server
+itself never migrates or seeds the database. Profile saves rely on the
+unique indexes it creates, so it stops with an error rather than leaving
+them out.
+"""
+from app import create_app
+
+app = create_app({'PRECOMPILE_TEMPLATES': True})